@@ -26,10 +26,8 @@ async def get_attachments(
     Returns a list of all attachments accessible to the authenticated user.
     """
     try:
-        items = db.query(Attachment).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(Attachment).order_by(Attachment.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/attachments"
@@ -27,10 +27,8 @@ async def get_custom_fields(
     Returns a list of all custom_fields accessible to the authenticated user.
     """
     try:
-        items = db.query(CustomField).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(CustomField).order_by(CustomField.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/custom_fields"
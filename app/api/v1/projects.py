@@ -17,10 +17,13 @@ from app.utils.pagination import PaginationParams, create_paginated_response
 from app.utils.responses import format_success_response, format_list_response, format_error_response
 from app.utils.errors import NotFoundError
 from app.utils.request_parsing import parse_request_body
+from app.utils.gid_validation import gid_validator
 from app.config import settings
 
 router = APIRouter()
 
+_validate_project_gid = gid_validator("project")
+
 
 @router.get("/projects", response_model=dict)
 async def get_projects(
@@ -33,10 +36,8 @@ async def get_projects(
     Returns a list of all projects accessible to the authenticated user.
     """
     try:
-        items = db.query(Project).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(Project).order_by(Project.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/projects"
@@ -115,8 +116,7 @@ async def get_project(
     """
     try:
         # Validate GID format first (matches Asana behavior - returns 400 for invalid format)
-        from app.utils.gid_validation import validate_gid_format
-        validate_gid_format(project_gid, "project")
+        _validate_project_gid(project_gid)
         
         obj = db.query(Project).filter(Project.gid == project_gid).first()
         
@@ -269,8 +269,7 @@ async def update_project(
     """
     try:
         # Validate GID format first (matches Asana behavior - returns 400 for invalid format)
-        from app.utils.gid_validation import validate_gid_format
-        validate_gid_format(project_gid, "project")
+        _validate_project_gid(project_gid)
         
         obj = db.query(Project).filter(Project.gid == project_gid).first()
         
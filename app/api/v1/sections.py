@@ -27,10 +27,8 @@ async def get_sections(
     Returns a list of all sections accessible to the authenticated user.
     """
     try:
-        items = db.query(Section).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(Section).order_by(Section.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/sections"
@@ -38,7 +36,7 @@ async def get_sections(
         
         response_data = {
             "data": [
-                SectionResponse(
+                SectionResponse.model_construct(
                     gid=obj.gid,
                     resource_type=obj.resource_type,
                     created_at=obj.created_at,
@@ -85,7 +83,7 @@ async def get_section(
         if not obj:
             raise NotFoundError("Section", section_gid)
         
-        obj_response = SectionResponse(
+        obj_response = SectionResponse.model_construct(
             gid=obj.gid,
             resource_type=obj.resource_type,
             created_at=obj.created_at,
@@ -141,7 +139,7 @@ async def create_section(
         db.commit()
         db.refresh(new_obj)
         
-        obj_response = SectionResponse(
+        obj_response = SectionResponse.model_construct(
             gid=new_obj.gid,
             resource_type=new_obj.resource_type,
             created_at=new_obj.created_at,
@@ -192,7 +190,7 @@ async def update_section(
         db.commit()
         db.refresh(obj)
         
-        obj_response = SectionResponse(
+        obj_response = SectionResponse.model_construct(
             gid=obj.gid,
             resource_type=obj.resource_type,
             created_at=obj.created_at,
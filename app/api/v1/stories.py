@@ -26,10 +26,8 @@ async def get_stories(
     Returns a list of all stories accessible to the authenticated user.
     """
     try:
-        items = db.query(Story).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(Story).order_by(Story.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/stories"
@@ -26,10 +26,8 @@ async def get_tags(
     Returns a list of all tags accessible to the authenticated user.
     """
     try:
-        items = db.query(Tag).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(Tag).order_by(Tag.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/tags"
@@ -37,7 +35,7 @@ async def get_tags(
         
         response_data = {
             "data": [
-                TagResponse(
+                TagResponse.model_construct(
                     gid=obj.gid,
                     resource_type=obj.resource_type,
                     created_at=obj.created_at,
@@ -87,7 +85,7 @@ async def get_tag(
         if not obj:
             raise NotFoundError("Tag", tag_gid)
         
-        obj_response = TagResponse(
+        obj_response = TagResponse.model_construct(
             gid=obj.gid,
             resource_type=obj.resource_type,
             created_at=obj.created_at,
@@ -142,7 +140,7 @@ async def create_tag(
         db.commit()
         db.refresh(new_obj)
         
-        obj_response = TagResponse(
+        obj_response = TagResponse.model_construct(
             gid=new_obj.gid,
             resource_type=new_obj.resource_type,
             created_at=new_obj.created_at,
@@ -196,7 +194,7 @@ async def update_tag(
         db.commit()
         db.refresh(obj)
         
-        obj_response = TagResponse(
+        obj_response = TagResponse.model_construct(
             gid=obj.gid,
             resource_type=obj.resource_type,
             created_at=obj.created_at,
@@ -1,24 +1,47 @@
 """Tasks API Endpoints"""
 from fastapi import APIRouter, Depends, Query, Body, HTTPException
 from sqlalchemy.orm import Session
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from collections import OrderedDict
 import uuid
 from app.database import get_db
 from app.models.task import Task
-from app.schemas.task import TaskResponse, TaskCreate, TaskUpdate
+from app.schemas.task import TaskResponse, TaskCreate, TaskUpdate, TaskResponseListAdapter
 from app.schemas.common import (
     TaskDuplicateRequest, TaskAddProjectRequest, TaskRemoveProjectRequest,
     TaskAddTagRequest, TaskRemoveTagRequest, AddFollowersRequest, RemoveFollowersRequest,
     TaskSetParentRequest, ModifyDependenciesRequest, ModifyDependentsRequest, EmptyResponse
 )
 from app.utils.pagination import PaginationParams, create_paginated_response
-from app.utils.responses import format_success_response, format_list_response, format_error_response
+from app.utils.responses import (
+    format_success_response,
+    format_list_response,
+    format_json_list_response,
+    format_error_response,
+    RawJSONResponse,
+)
 from app.utils.errors import NotFoundError
 from app.utils.request_parsing import parse_request_body
+from app.utils.gid_validation import gid_validator
 from app.config import settings
 
 router = APIRouter()
 
+_validate_task_gid = gid_validator("task")
+
+# Rendered GET /tasks/{task_gid} bodies, keyed by gid and tagged with the row's
+# (updated_at, modified_at) so an entry is only reused while the row is unchanged
+_TASK_RESPONSE_CACHE: "OrderedDict[str, Tuple[Tuple[Any, Any], bytes]]" = OrderedDict()
+_TASK_RESPONSE_CACHE_SIZE = 4096
+
+
+def _cache_task_response(task_gid: str, version: Tuple[Any, Any], body: bytes) -> None:
+    """Store a rendered task body, evicting the least recently used entry"""
+    _TASK_RESPONSE_CACHE[task_gid] = (version, body)
+    _TASK_RESPONSE_CACHE.move_to_end(task_gid)
+    if len(_TASK_RESPONSE_CACHE) > _TASK_RESPONSE_CACHE_SIZE:
+        _TASK_RESPONSE_CACHE.popitem(last=False)
+
 
 @router.get("/tasks", response_model=dict)
 async def get_tasks(
@@ -31,74 +54,26 @@ async def get_tasks(
     Returns a list of all tasks accessible to the authenticated user.
     """
     try:
-        items = db.query(Task).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(Task).order_by(Task.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/tasks"
         )
         
-        response_data = {
-            "data": [
-                TaskResponse(
-                    gid=obj.gid,
-                    resource_type=obj.resource_type,
-                    created_at=obj.created_at,
-                    updated_at=obj.updated_at,
-                    name=obj.name,
-                    resource_subtype=obj.resource_subtype,
-                    created_by=obj.created_by,
-                    approval_status=obj.approval_status,
-                    assignee_status=obj.assignee_status,
-                    completed=obj.completed,
-                    completed_at=obj.completed_at,
-                    due_at=obj.due_at,
-                    due_on=obj.due_on,
-                    external=obj.external,
-                    html_notes=obj.html_notes,
-                    hearted=obj.hearted,
-                    is_rendered_as_separator=obj.is_rendered_as_separator,
-                    liked=obj.liked,
-                    memberships=obj.memberships,
-                    modified_at=obj.modified_at,
-                    notes=obj.notes,
-                    num_hearts=obj.num_hearts,
-                    num_likes=obj.num_likes,
-                    num_subtasks=obj.num_subtasks,
-                    start_at=obj.start_at,
-                    start_on=obj.start_on,
-                    actual_time_minutes=obj.actual_time_minutes,
-                    permalink_url=obj.permalink_url,
-                    dependencies=None,
-                    dependents=None,
-                    hearts=None,
-                    likes=None,
-                    custom_fields=None,
-                    followers=None,
-                    projects=None,
-                    tags=None,
-                    completed_by=None,
-                    assignee=None,
-                    assignee_section=None,
-                    parent=None,
-                    custom_type=None,
-                    custom_type_status_option=None,
-                    workspace=None
-                ).model_dump(exclude_none=True)
-                for obj in paginated.data
-            ]
-        }
-        
+        next_page = None
         if paginated.has_more and paginated.next_offset:
-            response_data["next_page"] = {
+            next_page = {
                 "offset": paginated.next_offset,
                 "path": f"{settings.API_V1_PREFIX}/tasks",
                 "uri": f"{settings.API_V1_PREFIX}/tasks?limit={pagination.limit}&offset={paginated.next_offset}"
             }
         
-        return response_data
+        return format_json_list_response(
+            TaskResponseListAdapter,
+            TaskResponseListAdapter.validate_python(paginated.data, from_attributes=True),
+            next_page=next_page
+        )
     
     except Exception as e:
         return format_error_response(
@@ -121,14 +96,19 @@ async def get_task(
     """
     try:
         # Validate GID format first (matches Asana behavior - returns 400 for invalid format)
-        from app.utils.gid_validation import validate_gid_format
-        validate_gid_format(task_gid, "task")
+        _validate_task_gid(task_gid)
         
         obj = db.query(Task).filter(Task.gid == task_gid).first()
         
         if not obj:
             raise NotFoundError("Task", task_gid)
         
+        version = (obj.updated_at, obj.modified_at)
+        cached = _TASK_RESPONSE_CACHE.get(task_gid)
+        if cached is not None and cached[0] == version:
+            _TASK_RESPONSE_CACHE.move_to_end(task_gid)
+            return RawJSONResponse(content=cached[1])
+        
         obj_response = TaskResponse(
             gid=obj.gid,
             resource_type=obj.resource_type,
@@ -145,27 +125,17 @@ async def get_task(
             due_on=obj.due_on,
             external=obj.external,
             html_notes=obj.html_notes,
-            hearted=obj.hearted,
             is_rendered_as_separator=obj.is_rendered_as_separator,
             liked=obj.liked,
             memberships=obj.memberships,
             modified_at=obj.modified_at,
             notes=obj.notes,
-            num_hearts=obj.num_hearts,
             num_likes=obj.num_likes,
             num_subtasks=obj.num_subtasks,
             start_at=obj.start_at,
             start_on=obj.start_on,
             actual_time_minutes=obj.actual_time_minutes,
             permalink_url=obj.permalink_url,
-            dependencies=None,
-            dependents=None,
-            hearts=None,
-            likes=None,
-            custom_fields=None,
-            followers=None,
-            projects=None,
-            tags=None,
             completed_by=None,
             assignee=None,
             assignee_section=None,
@@ -175,7 +145,9 @@ async def get_task(
             workspace=None
         )
         
-        return format_success_response(obj_response)
+        response = format_success_response(obj_response)
+        _cache_task_response(task_gid, version, response.body)
+        return response
     
     except HTTPException:
         raise
@@ -235,27 +207,17 @@ async def create_task(
             due_on=new_obj.due_on,
             external=new_obj.external,
             html_notes=new_obj.html_notes,
-            hearted=new_obj.hearted,
             is_rendered_as_separator=new_obj.is_rendered_as_separator,
             liked=new_obj.liked,
             memberships=new_obj.memberships,
             modified_at=new_obj.modified_at,
             notes=new_obj.notes,
-            num_hearts=new_obj.num_hearts,
             num_likes=new_obj.num_likes,
             num_subtasks=new_obj.num_subtasks,
             start_at=new_obj.start_at,
             start_on=new_obj.start_on,
             actual_time_minutes=new_obj.actual_time_minutes,
             permalink_url=new_obj.permalink_url,
-            dependencies=None,
-            dependents=None,
-            hearts=None,
-            likes=None,
-            custom_fields=None,
-            followers=None,
-            projects=None,
-            tags=None,
             completed_by=None,
             assignee=None,
             assignee_section=None,
@@ -291,8 +253,7 @@ async def update_task(
     """
     try:
         # Validate GID format first (matches Asana behavior - returns 400 for invalid format)
-        from app.utils.gid_validation import validate_gid_format
-        validate_gid_format(task_gid, "task")
+        _validate_task_gid(task_gid)
         
         obj = db.query(Task).filter(Task.gid == task_gid).first()
         
@@ -311,6 +272,7 @@ async def update_task(
         
         db.commit()
         db.refresh(obj)
+        _TASK_RESPONSE_CACHE.pop(task_gid, None)
         
         obj_response = TaskResponse(
             gid=obj.gid,
@@ -328,27 +290,17 @@ async def update_task(
             due_on=obj.due_on,
             external=obj.external,
             html_notes=obj.html_notes,
-            hearted=obj.hearted,
             is_rendered_as_separator=obj.is_rendered_as_separator,
             liked=obj.liked,
             memberships=obj.memberships,
             modified_at=obj.modified_at,
             notes=obj.notes,
-            num_hearts=obj.num_hearts,
             num_likes=obj.num_likes,
             num_subtasks=obj.num_subtasks,
             start_at=obj.start_at,
             start_on=obj.start_on,
             actual_time_minutes=obj.actual_time_minutes,
             permalink_url=obj.permalink_url,
-            dependencies=None,
-            dependents=None,
-            hearts=None,
-            likes=None,
-            custom_fields=None,
-            followers=None,
-            projects=None,
-            tags=None,
             completed_by=None,
             assignee=None,
             assignee_section=None,
@@ -394,6 +346,7 @@ async def delete_task(
         
         db.delete(obj)
         db.commit()
+        _TASK_RESPONSE_CACHE.pop(task_gid, None)
         
         return format_success_response({"data": {}}, status_code=200)
     
@@ -429,27 +382,17 @@ def _build_task_response(task: Task) -> TaskResponse:
         due_on=task.due_on,
         external=task.external,
         html_notes=task.html_notes,
-        hearted=task.hearted,
         is_rendered_as_separator=task.is_rendered_as_separator,
         liked=task.liked,
         memberships=task.memberships,
         modified_at=task.modified_at,
         notes=task.notes,
-        num_hearts=task.num_hearts,
         num_likes=task.num_likes,
         num_subtasks=task.num_subtasks,
         start_at=task.start_at,
         start_on=task.start_on,
         actual_time_minutes=task.actual_time_minutes,
         permalink_url=task.permalink_url,
-        dependencies=None,
-        dependents=None,
-        hearts=None,
-        likes=None,
-        custom_fields=None,
-        followers=None,
-        projects=None,
-        tags=None,
         completed_by=None,
         assignee=None,
         assignee_section=None,
@@ -1187,27 +1130,17 @@ async def set_task_parent(
             due_on=task.due_on,
             external=task.external,
             html_notes=task.html_notes,
-            hearted=task.hearted,
             is_rendered_as_separator=task.is_rendered_as_separator,
             liked=task.liked,
             memberships=task.memberships,
             modified_at=task.modified_at,
             notes=task.notes,
-            num_hearts=task.num_hearts,
             num_likes=task.num_likes,
             num_subtasks=task.num_subtasks,
             start_at=task.start_at,
             start_on=task.start_on,
             actual_time_minutes=task.actual_time_minutes,
             permalink_url=task.permalink_url,
-            dependencies=None,
-            dependents=None,
-            hearts=None,
-            likes=None,
-            custom_fields=None,
-            followers=None,
-            projects=None,
-            tags=None,
             completed_by=None,
             assignee=None,
             assignee_section=None,
@@ -6,10 +6,15 @@ import uuid
 from app.database import get_db
 from app.models.team import Team
 from app.models.user import User
-from app.schemas.team import TeamResponse, TeamCreate, TeamUpdate
+from app.schemas.team import TeamResponse, TeamCreate, TeamUpdate, TeamResponseListAdapter
 from app.schemas.common import TeamAddUserRequest, TeamRemoveUserRequest, EmptyResponse
 from app.utils.pagination import PaginationParams, create_paginated_response
-from app.utils.responses import format_success_response, format_list_response, format_error_response
+from app.utils.responses import (
+    format_success_response,
+    format_list_response,
+    format_json_list_response,
+    format_error_response,
+)
 from app.utils.errors import NotFoundError
 from app.utils.request_parsing import parse_request_body
 from app.config import settings
@@ -28,50 +33,26 @@ async def get_teams(
     Returns a list of all teams accessible to the authenticated user.
     """
     try:
-        items = db.query(Team).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(Team).order_by(Team.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/teams"
         )
         
-        response_data = {
-            "data": [
-                TeamResponse(
-                    gid=obj.gid,
-                    resource_type=obj.resource_type,
-                    created_at=obj.created_at,
-                    updated_at=obj.updated_at,
-                    name=obj.name,
-                    description=obj.description,
-                    html_description=obj.html_description,
-                    permalink_url=obj.permalink_url,
-                    visibility=obj.visibility,
-                    edit_team_name_or_description_access_level=obj.edit_team_name_or_description_access_level,
-                    edit_team_visibility_or_trash_team_access_level=obj.edit_team_visibility_or_trash_team_access_level,
-                    member_invite_management_access_level=obj.member_invite_management_access_level,
-                    guest_invite_management_access_level=obj.guest_invite_management_access_level,
-                    join_request_management_access_level=obj.join_request_management_access_level,
-                    team_member_removal_access_level=obj.team_member_removal_access_level,
-                    team_content_management_access_level=obj.team_content_management_access_level,
-                    endorsed=obj.endorsed,
-                    organization=None,
-                    custom_field_settings=None
-                ).model_dump(exclude_none=True)
-                for obj in paginated.data
-            ]
-        }
-        
+        next_page = None
         if paginated.has_more and paginated.next_offset:
-            response_data["next_page"] = {
+            next_page = {
                 "offset": paginated.next_offset,
                 "path": f"{settings.API_V1_PREFIX}/teams",
                 "uri": f"{settings.API_V1_PREFIX}/teams?limit={pagination.limit}&offset={paginated.next_offset}"
             }
         
-        return response_data
+        return format_json_list_response(
+            TeamResponseListAdapter,
+            TeamResponseListAdapter.validate_python(paginated.data, from_attributes=True),
+            next_page=next_page
+        )
     
     except Exception as e:
         return format_error_response(
@@ -117,7 +98,6 @@ async def get_team(
             team_content_management_access_level=obj.team_content_management_access_level,
             endorsed=obj.endorsed,
             organization=None,
-            custom_field_settings=None
         )
         
         return format_success_response(obj_response)
@@ -181,7 +161,6 @@ async def create_team(
             team_content_management_access_level=new_obj.team_content_management_access_level,
             endorsed=new_obj.endorsed,
             organization=None,
-            custom_field_settings=None
         )
         
         return format_success_response(obj_response, status_code=201)
@@ -246,7 +225,6 @@ async def update_team(
             team_content_management_access_level=obj.team_content_management_access_level,
             endorsed=obj.endorsed,
             organization=None,
-            custom_field_settings=None
         )
         
         return format_success_response(obj_response)
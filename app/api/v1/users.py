@@ -9,10 +9,13 @@ from app.utils.pagination import PaginationParams, create_paginated_response
 from app.utils.responses import format_success_response, format_list_response, format_error_response
 from app.utils.errors import NotFoundError
 from app.utils.request_parsing import parse_request_body
+from app.utils.gid_validation import gid_validator
 from app.config import settings
 
 router = APIRouter()
 
+_validate_user_gid = gid_validator("user")
+
 
 @router.post("/users", response_model=dict)
 async def create_user(
@@ -44,10 +47,8 @@ async def get_users(
     Returns a list of all users accessible to the authenticated user.
     """
     try:
-        users = db.query(User).all()
-        
         paginated = create_paginated_response(
-            items=users,
+            query=db.query(User).order_by(User.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/users"
@@ -98,8 +99,7 @@ async def get_user(
     """
     try:
         # Validate GID format first (matches Asana behavior - returns 400 for invalid format)
-        from app.utils.gid_validation import validate_gid_format
-        validate_gid_format(user_gid, "user")
+        _validate_user_gid(user_gid)
         
         user = db.query(User).filter(User.gid == user_gid).first()
         
@@ -149,8 +149,7 @@ async def update_user(
     """
     try:
         # Validate GID format first (matches Asana behavior - returns 400 for invalid format)
-        from app.utils.gid_validation import validate_gid_format
-        validate_gid_format(user_gid, "user")
+        _validate_user_gid(user_gid)
         
         user = db.query(User).filter(User.gid == user_gid).first()
         
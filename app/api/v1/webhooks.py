@@ -26,10 +26,8 @@ async def get_webhooks(
     Returns a list of all webhooks accessible to the authenticated user.
     """
     try:
-        items = db.query(Webhook).all()
-        
         paginated = create_paginated_response(
-            items=items,
+            query=db.query(Webhook).order_by(Webhook.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/webhooks"
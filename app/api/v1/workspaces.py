@@ -15,13 +15,18 @@ from app.utils.responses import format_success_response, format_list_response, f
 from app.utils.errors import NotFoundError
 from app.utils.request_parsing import parse_request_body
 from app.utils.search import TaskSearchParams, build_task_search_query
-from app.utils.typeahead import TypeaheadParams, search_typeahead
-from app.utils.gid_validation import validate_gid_format
+from app.utils.typeahead import TypeaheadParams, search_typeahead, search_typeahead_multi
+from app.utils.gid_validation import gid_validator
 from app.schemas.task import TaskCompact
 from app.config import settings
 
 router = APIRouter()
 
+_validate_workspace_gid = gid_validator("workspace")
+
+# Bound once so the per-row loop in task search skips the class __init__ dispatch
+_validate_task_compact = TaskCompact.__pydantic_validator__.validate_python
+
 
 @router.get("/workspaces", response_model=dict)
 async def get_workspaces(
@@ -34,12 +39,9 @@ async def get_workspaces(
     Returns a list of all workspaces accessible to the authenticated user.
     """
     try:
-        # Query all workspaces
-        workspaces = db.query(Workspace).all()
-        
         # Create paginated response
         paginated = create_paginated_response(
-            items=workspaces,
+            query=db.query(Workspace).order_by(Workspace.gid),
             limit=pagination.limit,
             offset=pagination.offset,
             base_path=f"{settings.API_V1_PREFIX}/workspaces"
@@ -89,7 +91,7 @@ async def get_workspace(
     """
     try:
         # Validate GID format (numeric string or UUID)
-        validate_gid_format(workspace_gid, "workspace")
+        _validate_workspace_gid(workspace_gid)
         
         workspace = db.query(Workspace).filter(Workspace.gid == workspace_gid).first()
         
@@ -136,7 +138,7 @@ async def update_workspace(
     """
     try:
         # Validate GID format (numeric string or UUID)
-        validate_gid_format(workspace_gid, "workspace")
+        _validate_workspace_gid(workspace_gid)
         
         workspace = db.query(Workspace).filter(Workspace.gid == workspace_gid).first()
         
@@ -167,7 +169,7 @@ async def update_workspace(
         return format_success_response(workspace_response)
     
     except HTTPException:
-        # Re-raise HTTPException (from validate_gid_format)
+        # Re-raise HTTPException (from _validate_workspace_gid)
         raise
     except NotFoundError as e:
         return format_error_response(
@@ -677,13 +679,11 @@ async def get_task_by_custom_id(
             due_on=task.due_on,
             external=task.external,
             html_notes=task.html_notes,
-            hearted=task.hearted,
             is_rendered_as_separator=task.is_rendered_as_separator,
             liked=task.liked,
             memberships=task.memberships,
             modified_at=task.modified_at,
             notes=task.notes,
-            num_hearts=task.num_hearts,
             num_likes=task.num_likes,
             num_subtasks=task.num_subtasks,
             start_at=task.start_at,
@@ -691,14 +691,6 @@ async def get_task_by_custom_id(
             actual_time_minutes=task.actual_time_minutes,
             permalink_url=task.permalink_url,
             custom_id=task.custom_id,
-            dependencies=None,
-            dependents=None,
-            hearts=None,
-            likes=None,
-            custom_fields=None,
-            followers=None,
-            projects=None,
-            tags=None,
             completed_by=None,
             assignee=None,
             assignee_section=None,
@@ -742,8 +734,9 @@ async def search_tasks_for_workspace(
         if not workspace:
             raise NotFoundError("Workspace", workspace_gid)
         
-        # Build base query
-        base_query = db.query(Task)
+        # Build base query over just the columns TaskCompact needs, so result
+        # rows are plain tuples rather than hydrated Task instances
+        base_query = db.query(Task.gid, Task.resource_type, Task.name)
         
         # Apply search filters
         filtered_query = build_task_search_query(base_query, search_params)
@@ -760,11 +753,11 @@ async def search_tasks_for_workspace(
         
         # Convert to TaskCompact responses
         task_responses = [
-            TaskCompact(
-                gid=task.gid,
-                resource_type=task.resource_type or "task",
-                name=task.name or ""
-            )
+            _validate_task_compact({
+                "gid": task.gid,
+                "resource_type": task.resource_type or "task",
+                "name": task.name or ""
+            })
             for task in tasks
         ]
         
@@ -792,7 +785,7 @@ async def search_tasks_for_workspace(
 
 
 @router.get("/workspaces/{workspace_gid}/typeahead", response_model=dict)
-async def typeahead_for_workspace(
+def typeahead_for_workspace(
     workspace_gid: str,
     params: TypeaheadParams = Depends(),
     db: Session = Depends(get_db)
@@ -810,14 +803,29 @@ async def typeahead_for_workspace(
         if not workspace:
             raise NotFoundError("Workspace", workspace_gid)
         
-        # Perform typeahead search
-        results = search_typeahead(
-            db=db,
-            workspace_gid=workspace_gid,
-            resource_type=params.resource_type,
-            query=params.query,
-            count=params.count
-        )
+        # Perform typeahead search; several comma-separated types are batched
+        # into a single database round-trip. Repeats are dropped, order is kept
+        resource_types = list(dict.fromkeys(
+            rt.strip() for rt in params.resource_type.split(",") if rt.strip()
+        ))
+        if not resource_types:
+            results = []
+        elif len(resource_types) > 1:
+            results = search_typeahead_multi(
+                db=db,
+                workspace_gid=workspace_gid,
+                resource_types=resource_types,
+                query=params.query,
+                count=params.count
+            )
+        else:
+            results = search_typeahead(
+                db=db,
+                workspace_gid=workspace_gid,
+                resource_type=resource_types[0],
+                query=params.query,
+                count=params.count
+            )
         
         return format_list_response(results)
     
@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Asana Backend Replica"
     VERSION: str = "1.0.0"
     DEBUG: bool = False
+    DOCS_ENABLED: bool = True  # Set False in production to skip /docs, /redoc and /openapi.json
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
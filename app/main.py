@@ -3,6 +3,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.database import engine, Base
+from app.utils.responses import ORJSONResponse
 
 # Create database tables (will be replaced by Alembic migrations later)
 # Base.metadata.create_all(bind=engine)
@@ -12,9 +13,10 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="A backend service replicating core functionalities of Asana",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    docs_url="/docs" if settings.DOCS_ENABLED else None,
+    redoc_url="/redoc" if settings.DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if settings.DOCS_ENABLED else None,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -33,7 +35,7 @@ async def root():
     return {
         "message": "Asana Backend Replica API",
         "version": settings.VERSION,
-        "docs": "/docs"
+        "docs": app.docs_url
     }
 
 # Health check endpoint
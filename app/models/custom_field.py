@@ -1,5 +1,5 @@
 """SQLAlchemy model for CustomField"""
-from sqlalchemy import Column, String, DateTime, ARRAY, Boolean, Float, Integer, JSON, ForeignKey
+from sqlalchemy import Column, String, DateTime, ARRAY, Boolean, Float, Integer, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -40,6 +40,12 @@ class CustomField(Base):
     default_access_level = Column(String, nullable=True)
     resource_subtype = Column(String, nullable=True)
 
+    # lower(col) text_pattern_ops B-trees serve typeahead's case-insensitive
+    # prefix match
+    __table_args__ = (
+        Index("ix_custom_field_name_prefix", func.lower(name).label("name_lower"), postgresql_ops={"name_lower": "text_pattern_ops"}),
+    )
+
     # Relationships
     # TODO: Implement relationships
     # created_by_gid = Column(String, ForeignKey('user.gid'), nullable=False)
@@ -1,5 +1,5 @@
 """SQLAlchemy model for Project"""
-from sqlalchemy import Column, String, DateTime, Boolean, Date, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -35,6 +35,14 @@ class Project(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
     permalink_url = Column(String, nullable=True)
 
+    # lower(col) text_pattern_ops B-trees serve typeahead's case-insensitive
+    # prefix match;
+    # created_at DESC lets "newest first" typeahead stop after LIMIT rows
+    __table_args__ = (
+        Index("ix_project_name_prefix", func.lower(name).label("name_lower"), postgresql_ops={"name_lower": "text_pattern_ops"}),
+        Index("ix_project_created_at_desc", created_at.desc()),
+    )
+
     # Relationships
     # TODO: Implement relationships
     # current_status_gid = Column(String, ForeignKey('project.gid'), nullable=False)
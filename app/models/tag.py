@@ -1,5 +1,5 @@
 """SQLAlchemy model for Tag"""
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -20,6 +20,12 @@ class Tag(Base):
     notes = Column(String, nullable=True)
     permalink_url = Column(String, nullable=True)
 
+    # lower(col) text_pattern_ops B-trees serve typeahead's case-insensitive
+    # prefix match
+    __table_args__ = (
+        Index("ix_tag_name_prefix", func.lower(name).label("name_lower"), postgresql_ops={"name_lower": "text_pattern_ops"}),
+    )
+
     # Relationships
     # TODO: Implement relationships
     # workspace_gid = Column(String, ForeignKey('workspace.gid'), nullable=False)
@@ -1,6 +1,7 @@
 """SQLAlchemy model for Task"""
-from sqlalchemy import Column, String, DateTime, Boolean, Date, Float, Integer, JSON, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, String, DateTime, Boolean, Date, Float, Integer, JSON, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -30,7 +31,7 @@ class Task(Base):
     is_rendered_as_separator = Column(Boolean, nullable=True)
     liked = Column(Boolean, nullable=True)
     memberships = Column(JSON, nullable=True)
-    modified_at = Column(DateTime(timezone=True), nullable=True)
+    modified_at = Column(DateTime(timezone=True), nullable=True, index=True)
     notes = Column(String, nullable=True)
     num_hearts = Column(Integer, nullable=True)
     num_likes = Column(Integer, nullable=True)
@@ -41,6 +42,22 @@ class Task(Base):
     permalink_url = Column(String, nullable=True)
     custom_id = Column(String, nullable=True, unique=True, index=True)
 
+    # Full-text search document maintained by Postgres; deferred so regular
+    # task loads don't fetch it
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(name, '') || ' ' || coalesce(notes, ''))", persisted=True),
+    ))
+
+    # search_tsv GIN serves full-text task search; lower(col) text_pattern_ops
+    # B-trees serve typeahead's case-insensitive prefix match; created_at DESC
+    # lets "newest first" typeahead stop after LIMIT rows
+    __table_args__ = (
+        Index("ix_task_search_tsv", "search_tsv", postgresql_using="gin"),
+        Index("ix_task_name_prefix", func.lower(name).label("name_lower"), postgresql_ops={"name_lower": "text_pattern_ops"}),
+        Index("ix_task_created_at_desc", created_at.desc()),
+    )
+
     # Relationships
     # TODO: Implement relationships
     # completed_by_gid = Column(String, ForeignKey('user.gid'), nullable=False)
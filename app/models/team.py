@@ -1,5 +1,5 @@
 """SQLAlchemy model for Team"""
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -29,6 +29,12 @@ class Team(Base):
     team_content_management_access_level = Column(String, nullable=True)
     endorsed = Column(Boolean, nullable=True)
 
+    # lower(col) text_pattern_ops B-trees serve typeahead's case-insensitive
+    # prefix match
+    __table_args__ = (
+        Index("ix_team_name_prefix", func.lower(name).label("name_lower"), postgresql_ops={"name_lower": "text_pattern_ops"}),
+    )
+
     # Relationships
     # TODO: Implement relationships
     # organization_gid = Column(String, ForeignKey('workspace.gid'), nullable=False)
@@ -1,5 +1,5 @@
 """SQLAlchemy model for User"""
-from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy import Column, String, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -18,5 +18,12 @@ class User(Base):
     email = Column(String, nullable=True)
     photo = Column(JSON, nullable=True)
 
+    # lower(col) text_pattern_ops B-trees serve typeahead's case-insensitive
+    # prefix match
+    __table_args__ = (
+        Index("ix_user_name_prefix", func.lower(name).label("name_lower"), postgresql_ops={"name_lower": "text_pattern_ops"}),
+        Index("ix_user_email_prefix", func.lower(email).label("email_lower"), postgresql_ops={"email_lower": "text_pattern_ops"}),
+    )
+
     def __repr__(self):
         return f"<User(gid={self.gid})>"
\ No newline at end of file
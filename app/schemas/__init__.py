@@ -19,6 +19,8 @@ from app.schemas.task import (
     TaskCompact,
     TaskCreate,
     TaskUpdate,
+    ExternalRef,
+    TaskResponseListAdapter,
 )
 
 from app.schemas.user import (
@@ -33,6 +35,7 @@ from app.schemas.team import (
     TeamCompact,
     TeamCreate,
     TeamUpdate,
+    TeamResponseListAdapter,
 )
 
 from app.schemas.section import (
@@ -91,6 +94,8 @@ __all__ = [
     "TaskCompact",
     "TaskCreate",
     "TaskUpdate",
+    "ExternalRef",
+    "TaskResponseListAdapter",
     "UserResponse",
     "UserCompact",
     "UserCreate",
@@ -99,6 +104,7 @@ __all__ = [
     "TeamCompact",
     "TeamCreate",
     "TeamUpdate",
+    "TeamResponseListAdapter",
     "SectionResponse",
     "SectionCompact",
     "SectionCreate",
@@ -127,14 +133,14 @@ __all__ = [
 
 # Rebuild models with forward references
 # This is needed for forward references like 'UserCompact', 'ProjectCompact', etc.
+# Each model is rebuilt exactly once here. Task/Team Create and Update use
+# defer_build and are built on first use instead.
 # Rebuild in order: base types first, then dependent types
 WorkspaceCompact.model_rebuild()
 UserCompact.model_rebuild()
 ProjectCompact.model_rebuild()
-TeamCompact.model_rebuild()
 SectionCompact.model_rebuild()
 TagCompact.model_rebuild()
-TaskCompact.model_rebuild()
 StoryCompact.model_rebuild()
 CustomFieldCompact.model_rebuild()
 AttachmentCompact.model_rebuild()
@@ -144,8 +150,6 @@ SectionResponse.model_rebuild()
 TagResponse.model_rebuild()
 StoryResponse.model_rebuild()
 TaskResponse.model_rebuild()
-TaskCreate.model_rebuild()
-TaskUpdate.model_rebuild()
 ProjectResponse.model_rebuild()
 ProjectCreate.model_rebuild()
 ProjectUpdate.model_rebuild()
@@ -153,14 +157,14 @@ CustomFieldResponse.model_rebuild()
 CustomFieldCreate.model_rebuild()
 CustomFieldUpdate.model_rebuild()
 TeamResponse.model_rebuild()
-TeamCreate.model_rebuild()
-TeamUpdate.model_rebuild()
 AttachmentResponse.model_rebuild()
 AttachmentCreate.model_rebuild()
 AttachmentUpdate.model_rebuild()
 UserResponse.model_rebuild()
-UserCreate.model_rebuild()
-UserUpdate.model_rebuild()
-StoryResponse.model_rebuild()
 StoryCreate.model_rebuild()
-StoryUpdate.model_rebuild()
\ No newline at end of file
+StoryUpdate.model_rebuild()
+
+# List adapters wrap the response models above; rebuild them now that the
+# forward references are resolved
+TaskResponseListAdapter.rebuild()
+TeamResponseListAdapter.rebuild()
@@ -1,4 +1,4 @@
-"""Pydantic schema for Section Response"""
+"""Pydantic schemas for Section"""
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime, date
@@ -24,10 +24,6 @@ class SectionResponse(BaseModel):
             }
         }
 
-"""Pydantic schema for Section Compact (nested)"""
-from pydantic import BaseModel, Field
-from typing import Optional
-
 
 class SectionCompact(BaseModel):
     """Section compact schema for nested responses"""
@@ -39,11 +35,6 @@ class SectionCompact(BaseModel):
     class Config:
         from_attributes = True
 
-"""Pydantic schema for Section Create Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
-
 
 class SectionCreate(BaseModel):
     """Section create request schema"""
@@ -54,11 +45,6 @@ class SectionCreate(BaseModel):
     class Config:
         from_attributes = True
 
-"""Pydantic schema for Section Update Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
-
 
 class SectionUpdate(BaseModel):
     """Section update request schema"""
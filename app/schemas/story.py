@@ -1,5 +1,5 @@
-"""Pydantic schema for Story Response"""
-from pydantic import BaseModel, Field
+"""Pydantic schemas for Story"""
+from pydantic import BaseModel, Field, SkipValidation
 from typing import Optional, List
 from datetime import datetime, date
 
@@ -20,13 +20,13 @@ class StoryResponse(BaseModel):
     is_editable: Optional[bool] = Field(description="*Conditional*. Whether the text of the story can be edited after creation.", example=False)
     is_edited: Optional[bool] = Field(description="*Conditional*. Whether the text of the story has been edited after creation.", example=False)
     hearted: Optional[bool] = Field(description="*Deprecated - please use likes instead* *Conditional*. True if the story is hearted by the authorized user, false if not.", example=False)
-    hearts: Optional[List[dict]] = Field(description="*Deprecated - please use likes instead* *Conditional*. Array of likes for users who have hearted this story.")
+    hearts: SkipValidation[Optional[List[dict]]] = Field(description="*Deprecated - please use likes instead* *Conditional*. Array of likes for users who have hearted this story.")
     num_hearts: Optional[int] = Field(description="*Deprecated - please use likes instead* *Conditional*. The number of users who have hearted this story.", example=5)
     liked: Optional[bool] = Field(description="*Conditional*. True if the story is liked by the authorized user, false if not.", example=False)
-    likes: Optional[List[dict]] = Field(description="*Conditional*. Array of likes for users who have liked this story.")
+    likes: SkipValidation[Optional[List[dict]]] = Field(description="*Conditional*. Array of likes for users who have liked this story.")
     num_likes: Optional[int] = Field(description="*Conditional*. The number of users who have liked this story.", example=5)
-    reaction_summary: Optional[List[dict]] = Field(description="Summary of emoji reactions on this story.")
-    previews: Optional[List[dict]] = Field(description="<p><strong style={{ color: \"#4573D2\" }}>Full object requires scope: </strong><code>attachments:read</code></p> *Conditional*. A collection of previews to be displayed in the story. *Note: This property only exists for comment stories.*")
+    reaction_summary: SkipValidation[Optional[List[dict]]] = Field(description="Summary of emoji reactions on this story.")
+    previews: SkipValidation[Optional[List[dict]]] = Field(description="<p><strong style={{ color: \"#4573D2\" }}>Full object requires scope: </strong><code>attachments:read</code></p> *Conditional*. A collection of previews to be displayed in the story. *Note: This property only exists for comment stories.*")
     old_name: Optional[str] = Field(description="*Conditional* The previous name of the task before a name change.", example='This was the old name')
     new_name: Optional[str] = Field(description="*Conditional* The updated name of the task after a name change.", example='This is the new name')
     old_dates: Optional[str] = None
@@ -52,8 +52,8 @@ class StoryResponse(BaseModel):
     new_date_value: Optional['StoryCompact'] = None
     old_people_value: Optional[List['UserCompact']] = Field(description="*Conditional*. The old value of a people custom field story.")
     new_people_value: Optional[List['UserCompact']] = Field(description="*Conditional*. The new value of a people custom field story.")
-    old_multi_enum_values: Optional[List[dict]] = Field(description="*Conditional*. The old value of a multi-enum custom field story.")
-    new_multi_enum_values: Optional[List[dict]] = Field(description="*Conditional*. The new value of a multi-enum custom field story.")
+    old_multi_enum_values: SkipValidation[Optional[List[dict]]] = Field(description="*Conditional*. The old value of a multi-enum custom field story.")
+    new_multi_enum_values: SkipValidation[Optional[List[dict]]] = Field(description="*Conditional*. The new value of a multi-enum custom field story.")
     new_approval_status: Optional[str] = Field(description="*Conditional*. The new value of approval status.", example='approved')
     old_approval_status: Optional[str] = Field(description="*Conditional*. The old value of approval status.", example='pending')
     duplicate_of: Optional[str] = Field(description="*Conditional*")
@@ -72,10 +72,6 @@ class StoryResponse(BaseModel):
             }
         }
 
-"""Pydantic schema for Story Compact (nested)"""
-from pydantic import BaseModel, Field
-from typing import Optional
-
 
 class StoryCompact(BaseModel):
     """Story compact schema for nested responses"""
@@ -86,11 +82,6 @@ class StoryCompact(BaseModel):
     class Config:
         from_attributes = True
 
-"""Pydantic schema for Story Create Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
-
 
 class StoryCreate(BaseModel):
     """Story create request schema"""
@@ -108,11 +99,6 @@ class StoryCreate(BaseModel):
     class Config:
         from_attributes = True
 
-"""Pydantic schema for Story Update Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
-
 
 class StoryUpdate(BaseModel):
     """Story update request schema"""
@@ -1,4 +1,4 @@
-"""Pydantic schema for Tag Response"""
+"""Pydantic schemas for Tag"""
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime, date
@@ -27,10 +27,6 @@ class TagResponse(BaseModel):
             }
         }
 
-"""Pydantic schema for Tag Compact (nested)"""
-from pydantic import BaseModel, Field
-from typing import Optional
-
 
 class TagCompact(BaseModel):
     """Tag compact schema for nested responses"""
@@ -42,11 +38,6 @@ class TagCompact(BaseModel):
     class Config:
         from_attributes = True
 
-"""Pydantic schema for Tag Create Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
-
 
 class TagCreate(BaseModel):
     """Tag create request schema"""
@@ -59,11 +50,6 @@ class TagCreate(BaseModel):
     class Config:
         from_attributes = True
 
-"""Pydantic schema for Tag Update Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
-
 
 class TagUpdate(BaseModel):
     """Tag update request schema"""
@@ -1,105 +1,108 @@
-"""Pydantic schema for Team Response"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
+"""Pydantic schemas for Team"""
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, TypeAdapter
+from pydantic.dataclasses import dataclass
+from typing import Literal, Optional, List
 from datetime import datetime, date
 
+# Compact types referenced by the deferred Create/Update models resolve from
+# this module's namespace on first use.
+from app.schemas.custom_field import CustomFieldCompact
+from app.schemas.workspace import WorkspaceCompact
+
+# Enforced on create/update only; responses keep plain str (see schemas.task).
+_TeamVisibility = Literal["secret", "request_to_join", "public"]
+
+_TEAM_EXAMPLE = {
+    "gid": "12345",
+    "resource_type": "team",
+    "name": "Marketing",
+    "description": "All developers should be members of this team.",
+    "html_description": "<body><em>All</em> developers should be members of this team.</body>",
+    "permalink_url": "https://app.asana.com/0/resource/123456789/list",
+    "endorsed": False,
+}
+
+_TEAM_DESCR = {
+    "name": "The name of the team.",
+    "description": "[Opt In](/docs/inputoutput-options). The description of the team.",
+    "html_description": "[Opt In](/docs/inputoutput-options). The description of the team with formatting as HTML.",
+    "visibility": "The visibility of the team to users in the same organization",
+    "edit_team_name_or_description_access_level": "Controls who can edit team name and description",
+    "edit_team_visibility_or_trash_team_access_level": "Controls who can edit team visibility and trash teams",
+    "member_invite_management_access_level": "Controls who can accept or deny member invites for a given team",
+    "guest_invite_management_access_level": "Controls who can accept or deny guest invites for a given team",
+    "join_request_management_access_level": "Controls who can accept or deny join team requests for a Membership by Request team. This field can only be updated when the team's `visibility` field is `request_to_join`.",
+    "team_member_removal_access_level": "Controls who can remove team members",
+    "team_content_management_access_level": "Controls who can create and share content with the team",
+    "endorsed": "Whether the team has been endorsed",
+    "custom_field_settings": "Array of Custom Field Settings applied to the team.",
+}
+
 
 class TeamResponse(BaseModel):
     """Team response schema"""
 
-    gid: Optional[str] = Field(description="Globally unique identifier of the resource, as a string.", example='12345')
-    resource_type: Optional[str] = Field(description="The base type of this resource.", example='team')
-    name: Optional[str] = Field(description="The name of the team.", example='Marketing')
-    description: Optional[str] = Field(description="[Opt In](/docs/inputoutput-options). The description of the team.", example='All developers should be members of this team.')
-    html_description: Optional[str] = Field(description="[Opt In](/docs/inputoutput-options). The description of the team with formatting as HTML.", example='<body><em>All</em> developers should be members of this team.</body>')
+    gid: Optional[str] = Field(default=None, description="Globally unique identifier of the resource, as a string.")
+    resource_type: Optional[str] = Field(default=None, description="The base type of this resource.")
+    name: Optional[str] = Field(default=None, description=_TEAM_DESCR["name"])
+    description: Optional[str] = Field(default=None, description=_TEAM_DESCR["description"])
+    html_description: Optional[str] = Field(default=None, description=_TEAM_DESCR["html_description"])
     organization: Optional['WorkspaceCompact'] = None
-    permalink_url: Optional[str] = Field(description="A url that points directly to the object within Asana.", example='https://app.asana.com/0/resource/123456789/list')
-    visibility: Optional[str] = Field(description="The visibility of the team to users in the same organization")
-    edit_team_name_or_description_access_level: Optional[str] = Field(description="Controls who can edit team name and description")
-    edit_team_visibility_or_trash_team_access_level: Optional[str] = Field(description="Controls who can edit team visibility and trash teams")
-    member_invite_management_access_level: Optional[str] = Field(description="Controls who can accept or deny member invites for a given team")
-    guest_invite_management_access_level: Optional[str] = Field(description="Controls who can accept or deny guest invites for a given team")
-    join_request_management_access_level: Optional[str] = Field(description="Controls who can accept or deny join team requests for a Membership by Request team. This field can only be updated when the team's `visibility` field is `request_to_join`.")
-    team_member_removal_access_level: Optional[str] = Field(description="Controls who can remove team members")
-    team_content_management_access_level: Optional[str] = Field(description="Controls who can create and share content with the team")
-    endorsed: Optional[bool] = Field(description="Whether the team has been endorsed", example=False)
-    custom_field_settings: Optional[List['CustomFieldCompact']] = Field(description="Array of Custom Field Settings applied to the team.")
-
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "gid": "12345",
-                "resource_type": "team",
-                "name": "Example Name"
-            }
-        }
-
-"""Pydantic schema for Team Compact (nested)"""
-from pydantic import BaseModel, Field
-from typing import Optional
-
-
-class TeamCompact(BaseModel):
+    permalink_url: Optional[str] = Field(default=None, description="A url that points directly to the object within Asana.")
+    visibility: Optional[str] = Field(default=None, description=_TEAM_DESCR["visibility"])
+    edit_team_name_or_description_access_level: Optional[str] = Field(default=None, description=_TEAM_DESCR["edit_team_name_or_description_access_level"])
+    edit_team_visibility_or_trash_team_access_level: Optional[str] = Field(default=None, description=_TEAM_DESCR["edit_team_visibility_or_trash_team_access_level"])
+    member_invite_management_access_level: Optional[str] = Field(default=None, description=_TEAM_DESCR["member_invite_management_access_level"])
+    guest_invite_management_access_level: Optional[str] = Field(default=None, description=_TEAM_DESCR["guest_invite_management_access_level"])
+    join_request_management_access_level: Optional[str] = Field(default=None, description=_TEAM_DESCR["join_request_management_access_level"])
+    team_member_removal_access_level: Optional[str] = Field(default=None, description=_TEAM_DESCR["team_member_removal_access_level"])
+    team_content_management_access_level: Optional[str] = Field(default=None, description=_TEAM_DESCR["team_content_management_access_level"])
+    endorsed: Optional[bool] = Field(default=None, description=_TEAM_DESCR["endorsed"])
+    custom_field_settings: List['CustomFieldCompact'] = Field(default_factory=list, description=_TEAM_DESCR["custom_field_settings"])
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={"examples": [_TEAM_EXAMPLE]}
+    )
+
+
+@dataclass(slots=True, config=ConfigDict(from_attributes=True))
+class TeamCompact:
     """Team compact schema for nested responses"""
 
     gid: Optional[str] = Field(description="Globally unique identifier of the resource, as a string.")
     resource_type: Optional[str] = Field(description="The base type of this resource.")
     name: str = Field(description="The name of the team.")
 
-    class Config:
-        from_attributes = True
 
-"""Pydantic schema for Team Create Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
+class _TeamBase(BaseModel):
+    """Fields shared by the team create and update request schemas"""
 
+    name: Optional[StrictStr] = Field(None, max_length=1024, description=_TEAM_DESCR["name"])
+    description: Optional[StrictStr] = Field(None, max_length=65536, description=_TEAM_DESCR["description"])
+    html_description: Optional[StrictStr] = Field(None, max_length=65536, description=_TEAM_DESCR["html_description"])
+    organization: Optional['WorkspaceCompact'] = None
+    visibility: Optional[_TeamVisibility] = Field(None, description=_TEAM_DESCR["visibility"])
+    edit_team_name_or_description_access_level: Optional[str] = Field(None, description=_TEAM_DESCR["edit_team_name_or_description_access_level"])
+    edit_team_visibility_or_trash_team_access_level: Optional[str] = Field(None, description=_TEAM_DESCR["edit_team_visibility_or_trash_team_access_level"])
+    member_invite_management_access_level: Optional[str] = Field(None, description=_TEAM_DESCR["member_invite_management_access_level"])
+    guest_invite_management_access_level: Optional[str] = Field(None, description=_TEAM_DESCR["guest_invite_management_access_level"])
+    join_request_management_access_level: Optional[str] = Field(None, description=_TEAM_DESCR["join_request_management_access_level"])
+    team_member_removal_access_level: Optional[str] = Field(None, description=_TEAM_DESCR["team_member_removal_access_level"])
+    team_content_management_access_level: Optional[str] = Field(None, description=_TEAM_DESCR["team_content_management_access_level"])
+    endorsed: Optional[bool] = Field(None, description=_TEAM_DESCR["endorsed"])
+    custom_field_settings: Optional[List['CustomFieldCompact']] = Field(None, description=_TEAM_DESCR["custom_field_settings"])
 
-class TeamCreate(BaseModel):
-    """Team create request schema"""
+    model_config = ConfigDict(defer_build=True)
 
-    name: Optional[str] = Field(None, description="The name of the team.")
-    description: Optional[str] = Field(None, description="[Opt In](/docs/inputoutput-options). The description of the team.")
-    html_description: Optional[str] = Field(None, description="[Opt In](/docs/inputoutput-options). The description of the team with formatting as HTML.")
-    organization: Optional['WorkspaceCompact'] = None
-    visibility: Optional[str] = Field(None, description="The visibility of the team to users in the same organization")
-    edit_team_name_or_description_access_level: Optional[str] = Field(None, description="Controls who can edit team name and description")
-    edit_team_visibility_or_trash_team_access_level: Optional[str] = Field(None, description="Controls who can edit team visibility and trash teams")
-    member_invite_management_access_level: Optional[str] = Field(None, description="Controls who can accept or deny member invites for a given team")
-    guest_invite_management_access_level: Optional[str] = Field(None, description="Controls who can accept or deny guest invites for a given team")
-    join_request_management_access_level: Optional[str] = Field(None, description="Controls who can accept or deny join team requests for a Membership by Request team. This field can only be updated when the team's `visibility` field is `request_to_join`.")
-    team_member_removal_access_level: Optional[str] = Field(None, description="Controls who can remove team members")
-    team_content_management_access_level: Optional[str] = Field(None, description="Controls who can create and share content with the team")
-    endorsed: Optional[bool] = Field(None, description="Whether the team has been endorsed")
-    custom_field_settings: Optional[List['CustomFieldCompact']] = Field(None, description="Array of Custom Field Settings applied to the team.")
-
-    class Config:
-        from_attributes = True
-
-"""Pydantic schema for Team Update Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
+
+class TeamCreate(_TeamBase):
+    """Team create request schema"""
 
 
-class TeamUpdate(BaseModel):
+class TeamUpdate(_TeamBase):
     """Team update request schema"""
 
-    name: Optional[str] = Field(None, description="The name of the team.")
-    description: Optional[str] = Field(None, description="[Opt In](/docs/inputoutput-options). The description of the team.")
-    html_description: Optional[str] = Field(None, description="[Opt In](/docs/inputoutput-options). The description of the team with formatting as HTML.")
-    organization: Optional['WorkspaceCompact'] = None
-    visibility: Optional[str] = Field(None, description="The visibility of the team to users in the same organization")
-    edit_team_name_or_description_access_level: Optional[str] = Field(None, description="Controls who can edit team name and description")
-    edit_team_visibility_or_trash_team_access_level: Optional[str] = Field(None, description="Controls who can edit team visibility and trash teams")
-    member_invite_management_access_level: Optional[str] = Field(None, description="Controls who can accept or deny member invites for a given team")
-    guest_invite_management_access_level: Optional[str] = Field(None, description="Controls who can accept or deny guest invites for a given team")
-    join_request_management_access_level: Optional[str] = Field(None, description="Controls who can accept or deny join team requests for a Membership by Request team. This field can only be updated when the team's `visibility` field is `request_to_join`.")
-    team_member_removal_access_level: Optional[str] = Field(None, description="Controls who can remove team members")
-    team_content_management_access_level: Optional[str] = Field(None, description="Controls who can create and share content with the team")
-    endorsed: Optional[bool] = Field(None, description="Whether the team has been endorsed")
-    custom_field_settings: Optional[List['CustomFieldCompact']] = Field(None, description="Array of Custom Field Settings applied to the team.")
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+
+# Validates a whole page of ORM rows in one call on list endpoints
+TeamResponseListAdapter = TypeAdapter(List[TeamResponse])
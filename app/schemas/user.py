@@ -26,46 +26,40 @@ class UserResponse(BaseModel):
         }
 
 """Pydantic schema for User Compact (nested)"""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from typing import Optional
 
 
 class UserCompact(BaseModel):
     """User compact schema for nested responses"""
 
-    gid: Optional[str] = Field(description="Globally unique identifier of the resource, as a string.")
-    resource_type: Optional[str] = Field(description="The base type of this resource.")
-    name: str = Field(description="*Read-only except when same user as requester*. The user's name.")
+    gid: Optional[str] = None
+    resource_type: Optional[str] = None
+    name: str
 
     class Config:
         from_attributes = True
 
-"""Pydantic schema for User Create Request"""
-from pydantic import BaseModel, Field
+"""Pydantic schemas for User Create/Update Requests"""
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
-from datetime import datetime, date
+from app.schemas.custom_field import CustomFieldCompact
 
 
-class UserCreate(BaseModel):
-    """User create request schema"""
+class _UserBase(BaseModel):
+    """Fields shared by the user create and update request schemas"""
 
     name: Optional[str] = Field(None, description="*Read-only except when same user as requester*. The user's name.")
     custom_fields: Optional[List['CustomFieldCompact']] = Field(None, description="Array of Custom Fields.")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
-"""Pydantic schema for User Update Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
+
+class UserCreate(_UserBase):
+    """User create request schema"""
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(_UserBase):
     """User update request schema"""
 
     name: Optional[str] = Field(None, max_length=256, description="*Read-only except when same user as requester*. The user's name.")
-    custom_fields: Optional[List['CustomFieldCompact']] = Field(None, description="Array of Custom Fields.")
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
@@ -32,46 +32,38 @@ class WebhookResponse(BaseModel):
         }
 
 """Pydantic schema for Webhook Compact (nested)"""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from typing import Optional
 
 
 class WebhookCompact(BaseModel):
     """Webhook compact schema for nested responses"""
 
-    gid: Optional[str] = Field(description="Globally unique identifier of the resource, as a string.")
-    resource_type: Optional[str] = Field(description="The base type of this resource.")
+    gid: Optional[str] = None
+    resource_type: Optional[str] = None
 
     class Config:
         from_attributes = True
 
-"""Pydantic schema for Webhook Create Request"""
-from pydantic import BaseModel, Field
+"""Pydantic schemas for Webhook Create/Update Requests"""
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
-from datetime import datetime, date
 
 
-class WebhookCreate(BaseModel):
-    """Webhook create request schema"""
+class _WebhookBase(BaseModel):
+    """Fields shared by the webhook create and update request schemas"""
 
     resource: Optional[str] = None
-    target: Optional[str] = Field(None, description="The URL to receive the HTTP POST.")
     filters: Optional[List[str]] = Field(None, description="Whitelist of filters to apply to events from this webhook. If a webhook event passes any of the filters the event will be delivered; otherwise no event will be sent to the receiving server.")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
-"""Pydantic schema for Webhook Update Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
 
+class WebhookCreate(_WebhookBase):
+    """Webhook create request schema"""
 
-class WebhookUpdate(BaseModel):
-    """Webhook update request schema"""
+    target: Optional[str] = Field(None, description="The URL to receive the HTTP POST.")
 
-    resource: Optional[str] = None
-    filters: Optional[List[str]] = Field(None, description="Whitelist of filters to apply to events from this webhook. If a webhook event passes any of the filters the event will be delivered; otherwise no event will be sent to the receiving server.")
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+class WebhookUpdate(_WebhookBase):
+    """Webhook update request schema"""
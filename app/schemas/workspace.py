@@ -24,48 +24,38 @@ class WorkspaceResponse(BaseModel):
         }
 
 """Pydantic schema for Workspace Compact (nested)"""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from typing import Optional
 
 
 class WorkspaceCompact(BaseModel):
     """Workspace compact schema for nested responses"""
 
-    gid: Optional[str] = Field(description="Globally unique identifier of the resource, as a string.")
-    resource_type: Optional[str] = Field(description="The base type of this resource.")
-    name: str = Field(description="The name of the workspace.")
+    gid: Optional[str] = None
+    resource_type: Optional[str] = None
+    name: str
 
     class Config:
         from_attributes = True
 
-"""Pydantic schema for Workspace Create Request"""
-from pydantic import BaseModel, Field
+"""Pydantic schemas for Workspace Create/Update Requests"""
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
-from datetime import datetime, date
 
 
-class WorkspaceCreate(BaseModel):
-    """Workspace create request schema"""
+class _WorkspaceBase(BaseModel):
+    """Fields shared by the workspace create and update request schemas"""
 
     name: Optional[str] = Field(None, max_length=256, description="The name of the workspace.")
     email_domains: Optional[List[str]] = Field(None, description="The email domains that are associated with this workspace.")
     is_organization: Optional[bool] = Field(None, description="Whether the workspace is an *organization*.")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
-"""Pydantic schema for Workspace Update Request"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date
 
+class WorkspaceCreate(_WorkspaceBase):
+    """Workspace create request schema"""
 
-class WorkspaceUpdate(BaseModel):
-    """Workspace update request schema"""
-
-    name: Optional[str] = Field(None, max_length=256, description="The name of the workspace.")
-    email_domains: Optional[List[str]] = Field(None, description="The email domains that are associated with this workspace.")
-    is_organization: Optional[bool] = Field(None, description="Whether the workspace is an *organization*.")
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+class WorkspaceUpdate(_WorkspaceBase):
+    """Workspace update request schema"""
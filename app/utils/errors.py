@@ -80,14 +80,11 @@ def format_error_response(
     Returns:
         Formatted error response dictionary
     """
-    if errors is None:
-        errors = [{"message": message}]
-        if help_text:
-            errors[0]["help"] = help_text
-    
-    return {
-        "errors": errors
-    }
+    if errors is not None:
+        return {"errors": errors}
+    if not help_text:
+        return {"errors": [{"message": message}]}
+    return {"errors": [{"message": message, "help": help_text}]}
 
 
 def format_validation_errors(
@@ -1,6 +1,7 @@
 """Pagination Utilities for Asana API Format"""
-from typing import Optional, List, TypeVar, Generic, Dict, Any
+from typing import Optional, List, TypeVar, Generic
 from fastapi import Query
+from sqlalchemy.orm import Query as SQLQuery
 from app.config import settings
 
 T = TypeVar('T')
@@ -9,6 +10,8 @@ T = TypeVar('T')
 class PaginationParams:
     """Pagination parameters matching Asana API format"""
     
+    __slots__ = ("limit", "offset", "opt_fields", "opt_pretty")
+    
     def __init__(
         self,
         limit: int = Query(
@@ -39,6 +42,8 @@ class PaginationParams:
 class PaginatedResponse(Generic[T]):
     """Paginated response matching Asana API format"""
     
+    __slots__ = ("data", "limit", "offset", "has_more", "next_offset")
+    
     def __init__(
         self,
         data: List[T],
@@ -52,45 +57,26 @@ class PaginatedResponse(Generic[T]):
         self.offset = offset
         self.has_more = has_more
         self.next_offset = next_offset
-    
-    def to_dict(self, base_path: str = "") -> Dict[str, Any]:
-        """
-        Convert to dictionary matching Asana API format.
-        
-        Args:
-            base_path: Base path for constructing next_page URI
-        
-        Returns:
-            Dictionary with 'data' and optional 'next_page' keys
-        """
-        response = {
-            "data": [item.dict() if hasattr(item, 'dict') else item for item in self.data]
-        }
-        
-        if self.has_more and self.next_offset:
-            response["next_page"] = {
-                "offset": self.next_offset,
-                "path": base_path,
-                "uri": f"{base_path}?limit={self.limit}&offset={self.next_offset}"
-            }
-        
-        return response
 
 
 def create_paginated_response(
-    items: List[T],
-    limit: int,
+    items: Optional[List[T]] = None,
+    limit: int = settings.DEFAULT_PAGE_SIZE,
     offset: Optional[str] = None,
-    base_path: str = ""
+    base_path: str = "",
+    query: Optional[SQLQuery] = None
 ) -> PaginatedResponse[T]:
     """
-    Create a paginated response from a list of items.
+    Create a paginated response from a list of items or a database query.
     
     Args:
         items: List of items to paginate
         limit: Maximum number of items per page
         offset: Current offset token (if any)
         base_path: Base path for next_page URI
+        query: SQLAlchemy query to page through in the database instead of items;
+            must have a deterministic ORDER BY (e.g. the primary key) or pages
+            can repeat or skip rows
     
     Returns:
         PaginatedResponse object
@@ -104,10 +90,16 @@ def create_paginated_response(
         except (ValueError, TypeError):
             start_idx = 0
     
-    end_idx = start_idx + limit
-    paginated_items = items[start_idx:end_idx]
-    has_more = len(items) > end_idx
-    next_offset = str(end_idx) if has_more else None
+    # Fetch one row past the page as a sentinel for has_more instead of
+    # counting or materializing everything after it
+    if query is not None:
+        paginated_items = query.offset(start_idx).limit(limit + 1).all()
+    else:
+        paginated_items = items[start_idx:start_idx + limit + 1]
+    has_more = len(paginated_items) > limit
+    if has_more:
+        paginated_items = paginated_items[:limit]
+    next_offset = str(start_idx + limit) if has_more else None
     
     return PaginatedResponse(
         data=paginated_items,
@@ -116,4 +108,3 @@ def create_paginated_response(
         has_more=has_more,
         next_offset=next_offset
     )
-
@@ -5,13 +5,17 @@ from pydantic import BaseModel
 T = TypeVar('T', bound=BaseModel)
 
 
-def parse_request_body(request_body: dict, schema_class: Type[T]) -> T:
+def parse_request_body(request_body: dict, schema_class: Type[T], trusted: bool = False) -> T:
     """
     Parse request body that follows Asana API format: {"data": {...}}
     
     Args:
         request_body: The request body dict (may have "data" wrapper or not)
         schema_class: The Pydantic schema class to parse into
+        trusted: Skip validation via model_construct. Only for data that was
+            already validated (e.g. re-parsing our own stored values) - field
+            validators, coercion and defaults for nested models are bypassed.
+            Client request bodies must never be parsed with trusted=True.
     
     Returns:
         Parsed schema instance
@@ -23,6 +27,9 @@ def parse_request_body(request_body: dict, schema_class: Type[T]) -> T:
         # If no "data" wrapper, use the whole body
         data = request_body
     
+    if trusted:
+        return schema_class.model_construct(**data)
+    
     # Parse using the schema class
     return schema_class(**data)
 
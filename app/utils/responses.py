@@ -1,28 +1,40 @@
 """API Response Formatters matching Asana API format"""
 from typing import Any, Dict, Optional, List
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi import status
-import json
-from datetime import datetime, date
+import dataclasses
+import orjson
+from functools import lru_cache
+from pydantic import BaseModel, TypeAdapter
 
 
-def _serialize_datetime(obj: Any) -> Any:
-    """Recursively serialize datetime objects in nested structures"""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, date):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: _serialize_datetime(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_serialize_datetime(item) for item in obj]
-    return obj
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, which encodes datetime/date natively"""
+
+    # UTC is written as 'Z' and naive datetimes carry no offset, matching the
+    # timestamps pydantic-core emits on the model-serialized paths
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self._OPTIONS)
+
+
+class RawJSONResponse(Response):
+    """Response for a body that is already encoded JSON bytes"""
+
+    media_type = "application/json"
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(item_type: type) -> TypeAdapter:
+    """TypeAdapter for a list of one schema type, built once per type and reused"""
+    return TypeAdapter(List[item_type])
 
 
 def format_success_response(
     data: Any,
     status_code: int = status.HTTP_200_OK
-) -> JSONResponse:
+) -> Response:
     """
     Format successful response matching Asana API format.
     
@@ -31,32 +43,25 @@ def format_success_response(
         status_code: HTTP status code
     
     Returns:
-        JSONResponse with data wrapped in 'data' envelope
+        Response with data wrapped in 'data' envelope
     """
-    # Convert Pydantic models to dict with JSON serialization
-    if hasattr(data, 'dict'):
-        data = data.dict()
-    elif hasattr(data, 'model_dump'):
-        # Use mode='json' to serialize datetime and other non-JSON types
-        # exclude_none=True to exclude None values
-        try:
-            data = data.model_dump(mode='json', exclude_none=True)
-        except Exception:
-            # Fallback: try without mode='json' and serialize manually
-            data = data.model_dump(exclude_none=True)
-            data = _serialize_datetime(data)
-    
-    # Ensure any remaining datetime objects are serialized
-    data = _serialize_datetime(data)
+    # Pydantic models and pydantic dataclasses (e.g. TaskCompact) carry their own
+    # serializer, which writes JSON bytes without building an intermediate dict
+    serializer = getattr(data, "__pydantic_serializer__", None)
+    if serializer is not None and not isinstance(data, type):
+        body = b'{"data":' + serializer.to_json(data) + b"}"
+        return RawJSONResponse(content=body, status_code=status_code)
+    if dataclasses.is_dataclass(data) and not isinstance(data, type):
+        data = dataclasses.asdict(data)
     
     response_data = {"data": data}
-    return JSONResponse(content=response_data, status_code=status_code)
+    return ORJSONResponse(content=response_data, status_code=status_code)
 
 
 def format_list_response(
     items: List[Any],
     status_code: int = status.HTTP_200_OK
-) -> JSONResponse:
+) -> Response:
     """
     Format list response matching Asana API format.
     
@@ -65,21 +70,41 @@ def format_list_response(
         status_code: HTTP status code
     
     Returns:
-        JSONResponse with items wrapped in 'data' array
+        Response with items wrapped in 'data' array
     """
-    # Convert Pydantic models to dicts with JSON serialization
-    data_list = []
-    for item in items:
-        if hasattr(item, 'dict'):
-            data_list.append(item.dict())
-        elif hasattr(item, 'model_dump'):
-            # Use mode='json' to serialize datetime and other non-JSON types
-            data_list.append(item.model_dump(mode='json'))
-        else:
-            data_list.append(item)
+    # Items are homogeneous, so pick the serializer once from the first item and
+    # let pydantic-core write the whole list to JSON bytes in one call
+    if items and (isinstance(items[0], BaseModel) or dataclasses.is_dataclass(items[0])):
+        body = b'{"data":' + _list_adapter(type(items[0])).dump_json(items) + b"}"
+        return RawJSONResponse(content=body, status_code=status_code)
     
-    response_data = {"data": data_list}
-    return JSONResponse(content=response_data, status_code=status_code)
+    response_data = {"data": list(items)}
+    return ORJSONResponse(content=response_data, status_code=status_code)
+
+
+def format_json_list_response(
+    adapter: TypeAdapter,
+    items: List[Any],
+    next_page: Optional[Dict[str, Any]] = None,
+    status_code: int = status.HTTP_200_OK
+) -> RawJSONResponse:
+    """
+    Format list response by serializing items straight to JSON bytes.
+    
+    Args:
+        adapter: TypeAdapter for the list of response models
+        items: Validated response models to return
+        next_page: Optional next_page pagination object
+        status_code: HTTP status code
+    
+    Returns:
+        RawJSONResponse with items wrapped in 'data' array and optional 'next_page'
+    """
+    body = b'{"data":' + adapter.dump_json(items, exclude_none=True)
+    if next_page:
+        body += b',"next_page":' + orjson.dumps(next_page)
+    body += b"}"
+    return RawJSONResponse(content=body, status_code=status_code)
 
 
 def format_error_response(
@@ -87,7 +112,7 @@ def format_error_response(
     errors: Optional[List[Dict[str, Any]]] = None,
     help_text: Optional[str] = None,
     status_code: int = status.HTTP_400_BAD_REQUEST
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Format error response matching Asana API format.
     
@@ -98,13 +123,10 @@ def format_error_response(
         status_code: HTTP status code
     
     Returns:
-        JSONResponse with errors wrapped in 'errors' array
+        ORJSONResponse with errors wrapped in 'errors' array
     """
     if errors is None:
-        errors = [{"message": message}]
-        if help_text:
-            errors[0]["help"] = help_text
+        errors = [{"message": message, "help": help_text}] if help_text else [{"message": message}]
     
-    response_data = {"errors": errors}
-    return JSONResponse(content=response_data, status_code=status_code)
+    return ORJSONResponse(content={"errors": errors}, status_code=status_code)
 
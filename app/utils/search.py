@@ -1,13 +1,58 @@
 """Search utilities for task search endpoint"""
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, BeforeValidator, Field
+from typing import Annotated, Any, Optional, Tuple
 from fastapi import Query
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
+import operator
+import re
+from functools import lru_cache
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 from sqlalchemy import or_, and_, func
 from app.models.task import Task
 
 
+# Shorter text queries use substring matching instead of full-text search
+MIN_FULL_TEXT_LENGTH = 3
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 string, memoized since the same dates recur across requests"""
+    if len(value) == 4 and value.lower() == "null":
+        return None
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """Parse ISO 8601 date string"""
+    if not isinstance(value, str):
+        return value
+    if not value:
+        return None
+    parsed = _parse_iso_datetime(value)
+    return parsed.date() if parsed is not None else None
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """Parse ISO 8601 datetime string"""
+    if not isinstance(value, str):
+        return value
+    if not value:
+        return None
+    return _parse_iso_datetime(value)
+
+
+# Date/datetime query params are parsed once when the params are built;
+# unparseable values and the literal "null" become None (filter not applied)
+SearchDate = Annotated[Optional[date], BeforeValidator(parse_date)]
+SearchDateTime = Annotated[Optional[datetime], BeforeValidator(parse_datetime)]
+
+
 class TaskSearchParams(BaseModel):
     """Query parameters for task search endpoint"""
     # Text search
@@ -50,31 +95,31 @@ class TaskSearchParams(BaseModel):
     portfolios_any: Optional[str] = Field(None, alias="portfolios.any", description="Comma-separated list of portfolio IDs")
     
     # Date filters
-    due_on_before: Optional[str] = Field(None, alias="due_on.before", description="ISO 8601 date string")
-    due_on_after: Optional[str] = Field(None, alias="due_on.after", description="ISO 8601 date string")
-    due_on: Optional[str] = Field(None, description="ISO 8601 date string or `null`")
-    due_at_before: Optional[str] = Field(None, alias="due_at.before", description="ISO 8601 datetime string")
-    due_at_after: Optional[str] = Field(None, alias="due_at.after", description="ISO 8601 datetime string")
-    
-    start_on_before: Optional[str] = Field(None, alias="start_on.before", description="ISO 8601 date string")
-    start_on_after: Optional[str] = Field(None, alias="start_on.after", description="ISO 8601 date string")
-    start_on: Optional[str] = Field(None, description="ISO 8601 date string or `null`")
-    
-    created_on_before: Optional[str] = Field(None, alias="created_on.before", description="ISO 8601 date string")
-    created_on_after: Optional[str] = Field(None, alias="created_on.after", description="ISO 8601 date string")
-    created_on: Optional[str] = Field(None, description="ISO 8601 date string or `null`")
-    created_at_before: Optional[str] = Field(None, alias="created_at.before", description="ISO 8601 datetime string")
-    created_at_after: Optional[str] = Field(None, alias="created_at.after", description="ISO 8601 datetime string")
-    
-    completed_on_before: Optional[str] = Field(None, alias="completed_on.before", description="ISO 8601 date string")
-    completed_on_after: Optional[str] = Field(None, alias="completed_on.after", description="ISO 8601 date string")
-    completed_on: Optional[str] = Field(None, description="ISO 8601 date string or `null`")
-    completed_at_before: Optional[str] = Field(None, alias="completed_at.before", description="ISO 8601 datetime string")
-    completed_at_after: Optional[str] = Field(None, alias="completed_at.after", description="ISO 8601 datetime string")
-    
-    modified_on_before: Optional[str] = Field(None, alias="modified_on.before", description="ISO 8601 date string")
-    modified_on_after: Optional[str] = Field(None, alias="modified_on.after", description="ISO 8601 date string")
-    modified_on: Optional[str] = Field(None, description="ISO 8601 date string or `null`")
+    due_on_before: SearchDate = Field(None, alias="due_on.before", description="ISO 8601 date string")
+    due_on_after: SearchDate = Field(None, alias="due_on.after", description="ISO 8601 date string")
+    due_on: SearchDate = Field(None, description="ISO 8601 date string or `null`")
+    due_at_before: SearchDateTime = Field(None, alias="due_at.before", description="ISO 8601 datetime string")
+    due_at_after: SearchDateTime = Field(None, alias="due_at.after", description="ISO 8601 datetime string")
+    
+    start_on_before: SearchDate = Field(None, alias="start_on.before", description="ISO 8601 date string")
+    start_on_after: SearchDate = Field(None, alias="start_on.after", description="ISO 8601 date string")
+    start_on: SearchDate = Field(None, description="ISO 8601 date string or `null`")
+    
+    created_on_before: SearchDate = Field(None, alias="created_on.before", description="ISO 8601 date string")
+    created_on_after: SearchDate = Field(None, alias="created_on.after", description="ISO 8601 date string")
+    created_on: SearchDate = Field(None, description="ISO 8601 date string or `null`")
+    created_at_before: SearchDateTime = Field(None, alias="created_at.before", description="ISO 8601 datetime string")
+    created_at_after: SearchDateTime = Field(None, alias="created_at.after", description="ISO 8601 datetime string")
+    
+    completed_on_before: SearchDate = Field(None, alias="completed_on.before", description="ISO 8601 date string")
+    completed_on_after: SearchDate = Field(None, alias="completed_on.after", description="ISO 8601 date string")
+    completed_on: SearchDate = Field(None, description="ISO 8601 date string or `null`")
+    completed_at_before: SearchDateTime = Field(None, alias="completed_at.before", description="ISO 8601 datetime string")
+    completed_at_after: SearchDateTime = Field(None, alias="completed_at.after", description="ISO 8601 datetime string")
+    
+    modified_on_before: SearchDate = Field(None, alias="modified_on.before", description="ISO 8601 date string")
+    modified_on_after: SearchDate = Field(None, alias="modified_on.after", description="ISO 8601 date string")
+    modified_on: SearchDate = Field(None, description="ISO 8601 date string or `null`")
     
     # Status filters
     completed: Optional[bool] = Field(None, description="Filter by completion status")
@@ -89,31 +134,45 @@ class TaskSearchParams(BaseModel):
         from_attributes = True
 
 
-def parse_comma_separated_list(value: Optional[str]) -> List[str]:
-    """Parse comma-separated string into list"""
+# One comma-separated item with surrounding whitespace trimmed; empty items
+# never match, so they are skipped without a separate strip/filter pass
+_CSV_ITEM = re.compile(r"\s*([^,\s][^,]*?)\s*(?:,|$)")
+
+
+@lru_cache(maxsize=256)
+def parse_comma_separated_list(value: Optional[str]) -> Tuple[str, ...]:
+    """
+    Parse comma-separated string into a tuple of items.
+    
+    Memoized, since the same id lists are looked up once per filter key; the
+    result is a tuple so the cached value can be shared safely.
+    """
     if not value:
-        return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+        return ()
+    return tuple(_CSV_ITEM.findall(value))
 
 
-def parse_date(value: Optional[str]) -> Optional[date]:
-    """Parse ISO 8601 date string"""
-    if not value or value.lower() == "null":
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
-    except (ValueError, AttributeError):
-        return None
+# (param attribute, column, comparison) for the plain date/datetime filters;
+# modified_on* are handled separately as half-open ranges on modified_at
+COLUMN_FILTERS = (
+    ("due_on_before", Task.due_on, operator.le),
+    ("due_on_after", Task.due_on, operator.ge),
+    ("due_on", Task.due_on, operator.eq),
+    ("due_at_before", Task.due_at, operator.le),
+    ("due_at_after", Task.due_at, operator.ge),
+    ("start_on_before", Task.start_on, operator.le),
+    ("start_on_after", Task.start_on, operator.ge),
+    ("start_on", Task.start_on, operator.eq),
+    ("created_at_before", Task.created_at, operator.le),
+    ("created_at_after", Task.created_at, operator.ge),
+    ("completed_at_before", Task.completed_at, operator.le),
+    ("completed_at_after", Task.completed_at, operator.ge),
+)
 
 
-def parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    """Parse ISO 8601 datetime string"""
-    if not value or value.lower() == "null":
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
-        return None
+def day_start(value: date) -> datetime:
+    """Midnight at the start of a date, for half-open ranges on timestamp columns"""
+    return datetime.combine(value, time.min)
 
 
 def build_task_search_query(
@@ -130,102 +189,52 @@ def build_task_search_query(
     Returns:
         Filtered SQLAlchemy query
     """
-    query = base_query
+    # Collect every predicate and apply them with a single filter() call, so
+    # the query is copied once instead of once per active parameter
+    predicates = []
     
-    # Text search - ILIKE on name and notes
+    # Text search - full-text match on the generated search_tsv column (name +
+    # notes), served by its GIN index. Queries too short to form useful lexemes
+    # fall back to a substring ILIKE scan, which no index serves
     if params.text:
-        search_pattern = f"%{params.text}%"
-        query = query.filter(
-            or_(
-                Task.name.ilike(search_pattern),
-                Task.notes.ilike(search_pattern)
+        if len(params.text) < MIN_FULL_TEXT_LENGTH:
+            search_pattern = f"%{params.text}%"
+            predicates.append(
+                or_(
+                    Task.name.ilike(search_pattern),
+                    Task.notes.ilike(search_pattern)
+                )
+            )
+        else:
+            predicates.append(
+                Task.search_tsv.op("@@")(func.plainto_tsquery("english", params.text))
             )
-        )
     
     # Resource subtype filter
     if params.resource_subtype:
-        query = query.filter(Task.resource_subtype == params.resource_subtype)
+        predicates.append(Task.resource_subtype == params.resource_subtype)
     
     # Date filters
-    if params.due_on_before:
-        due_date = parse_date(params.due_on_before)
-        if due_date:
-            query = query.filter(Task.due_on <= due_date)
-    
-    if params.due_on_after:
-        due_date = parse_date(params.due_on_after)
-        if due_date:
-            query = query.filter(Task.due_on >= due_date)
-    
-    if params.due_on:
-        due_date = parse_date(params.due_on)
-        if due_date is not None:
-            query = query.filter(Task.due_on == due_date)
-    
-    if params.due_at_before:
-        due_datetime = parse_datetime(params.due_at_before)
-        if due_datetime:
-            query = query.filter(Task.due_at <= due_datetime)
-    
-    if params.due_at_after:
-        due_datetime = parse_datetime(params.due_at_after)
-        if due_datetime:
-            query = query.filter(Task.due_at >= due_datetime)
-    
-    if params.start_on_before:
-        start_date = parse_date(params.start_on_before)
-        if start_date:
-            query = query.filter(Task.start_on <= start_date)
-    
-    if params.start_on_after:
-        start_date = parse_date(params.start_on_after)
-        if start_date:
-            query = query.filter(Task.start_on >= start_date)
-    
-    if params.start_on:
-        start_date = parse_date(params.start_on)
-        if start_date is not None:
-            query = query.filter(Task.start_on == start_date)
-    
-    if params.created_at_before:
-        created_datetime = parse_datetime(params.created_at_before)
-        if created_datetime:
-            query = query.filter(Task.created_at <= created_datetime)
-    
-    if params.created_at_after:
-        created_datetime = parse_datetime(params.created_at_after)
-        if created_datetime:
-            query = query.filter(Task.created_at >= created_datetime)
-    
-    if params.completed_at_before:
-        completed_datetime = parse_datetime(params.completed_at_before)
-        if completed_datetime:
-            query = query.filter(Task.completed_at <= completed_datetime)
-    
-    if params.completed_at_after:
-        completed_datetime = parse_datetime(params.completed_at_after)
-        if completed_datetime:
-            query = query.filter(Task.completed_at >= completed_datetime)
+    for attr, column, compare in COLUMN_FILTERS:
+        value = getattr(params, attr)
+        if value is not None:
+            predicates.append(compare(column, value))
     
+    # modified_on is stored as the modified_at timestamp; compare against
+    # half-open [day, next day) ranges on the raw column so the index is usable
     if params.modified_on_before:
-        # Note: modified_on is stored as modified_at in the database
-        modified_date = parse_date(params.modified_on_before)
-        if modified_date:
-            query = query.filter(func.date(Task.modified_at) <= modified_date)
+        predicates.append(Task.modified_at < day_start(params.modified_on_before + timedelta(days=1)))
     
     if params.modified_on_after:
-        modified_date = parse_date(params.modified_on_after)
-        if modified_date:
-            query = query.filter(func.date(Task.modified_at) >= modified_date)
+        predicates.append(Task.modified_at >= day_start(params.modified_on_after))
     
     if params.modified_on:
-        modified_date = parse_date(params.modified_on)
-        if modified_date is not None:
-            query = query.filter(func.date(Task.modified_at) == modified_date)
+        predicates.append(Task.modified_at >= day_start(params.modified_on))
+        predicates.append(Task.modified_at < day_start(params.modified_on + timedelta(days=1)))
     
     # Boolean filters
     if params.completed is not None:
-        query = query.filter(Task.completed == params.completed)
+        predicates.append(Task.completed == params.completed)
     
     # Relationship filters - TODO: Implement when relationship tables exist
     # For now, these filters will be ignored with TODO comments
@@ -235,5 +244,7 @@ def build_task_search_query(
     # tags_any, tags_not, tags_all
     # teams_any, portfolios_any
     
-    return query
+    if not predicates:
+        return base_query
+    return base_query.filter(and_(*predicates))
 
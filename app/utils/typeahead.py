@@ -1,9 +1,12 @@
 """Typeahead search utilities"""
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Any, Callable, Optional, List, Tuple
+from collections import OrderedDict
+import threading
+import time
 from fastapi import Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import Select, bindparam, or_, func, literal, select, union_all
 from app.models.user import User
 from app.models.project import Project
 from app.models.task import Task
@@ -13,11 +16,55 @@ from app.models.custom_field import CustomField
 from app.schemas.common import AsanaNamedResource
 
 
+# Recent typeahead results keyed by (resource type(s), workspace, query, count).
+# Entries expire after a few seconds, so keystroke bursts are served from memory
+# while new or renamed resources still show up almost immediately
+_TYPEAHEAD_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[float, List[AsanaNamedResource]]]" = OrderedDict()
+_TYPEAHEAD_CACHE_SIZE = 1024
+_TYPEAHEAD_CACHE_TTL = 5.0
+# The typeahead endpoint is a sync handler running on the threadpool, so cache
+# lookups and insert/evict must not interleave across threads
+_TYPEAHEAD_CACHE_LOCK = threading.Lock()
+
+
+def _cached_typeahead(
+    key: Tuple[Any, ...],
+    search: Callable[[], List[AsanaNamedResource]]
+) -> List[AsanaNamedResource]:
+    """Return fresh cached results for key, or run search and cache its results"""
+    now = time.monotonic()
+    with _TYPEAHEAD_CACHE_LOCK:
+        cached = _TYPEAHEAD_CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            _TYPEAHEAD_CACHE.move_to_end(key)
+            return cached[1]
+    
+    # Query outside the lock so a slow search does not block other lookups
+    results = search()
+    with _TYPEAHEAD_CACHE_LOCK:
+        _TYPEAHEAD_CACHE[key] = (now + _TYPEAHEAD_CACHE_TTL, results)
+        _TYPEAHEAD_CACHE.move_to_end(key)
+        if len(_TYPEAHEAD_CACHE) > _TYPEAHEAD_CACHE_SIZE:
+            _TYPEAHEAD_CACHE.popitem(last=False)
+    return results
+
+
+def prefix_pattern(query: str) -> str:
+    """
+    LIKE pattern matching values that start with query.
+    
+    Compared against lower(column) so the lower(col) text_pattern_ops indexes
+    apply; LIKE wildcards in the query are escaped and match literally.
+    """
+    escaped = query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
 class TypeaheadParams(BaseModel):
     """Query parameters for typeahead endpoint"""
     resource_type: str = Query(
         ...,
-        description="The type of values the typeahead should return",
+        description="The type of values the typeahead should return. A comma-separated list searches several types in one query",
         enum=["custom_field", "goal", "project", "project_template", "portfolio", "tag", "task", "team", "user"]
     )
     type: Optional[str] = Query(None, description="Deprecated: use resource_type instead")
@@ -30,174 +77,116 @@ class TypeaheadParams(BaseModel):
         from_attributes = True
 
 
-def search_users(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
-    """Search users in a workspace"""
-    base_query = db.query(User)
+# resource_type -> (model, columns prefix-matched by the query, ordering)
+TYPEAHEAD_SOURCES = {
+    # TODO: Sort users by "most contacted" - requires contact tracking
+    "user": (User, (User.name, User.email), User.name),
+    # TODO: Sort projects by recency - requires visit tracking
+    "project": (Project, (Project.name,), Project.created_at.desc()),
+    # TODO: Prioritize followed tasks - requires follow tracking
+    "task": (Task, (Task.name,), Task.created_at.desc()),
+    "tag": (Tag, (Tag.name,), Tag.name),
+    "team": (Team, (Team.name,), Team.name),
+    "custom_field": (CustomField, (CustomField.name,), CustomField.name),
+    # Project templates are searched as projects until a project_template model
+    # or flag exists (TODO); favorited templates should sort first (TODO)
+    "project_template": (Project, (Project.name,), Project.name),
+}
+
+
+def _resource_type_column(resource_type: str, model: Any):
+    """resource_type expression for typeahead rows, shared by single and multi-type queries"""
+    if resource_type == "project_template":
+        # Override to match expected type
+        return literal(resource_type)
+    return func.coalesce(model.resource_type, resource_type)
+
+
+def _typeahead_statements(resource_type: str) -> Tuple[Select, Select]:
+    """
+    Build the (browse, search) statements for one resource type.
     
+    The pattern and row count are bind parameters, so each statement is built
+    and compiled once and reused from SQLAlchemy's compiled cache afterwards.
+    """
+    model, columns, order_by = TYPEAHEAD_SOURCES[resource_type]
+    browse = (
+        select(model.gid, _resource_type_column(resource_type, model).label("resource_type"), model.name)
+        .order_by(order_by)
+        .limit(bindparam("count"))
+    )
+    search = browse.where(
+        or_(*(func.lower(column).like(bindparam("pattern"), escape="\\") for column in columns))
+    )
+    return browse, search
+
+
+TYPEAHEAD_STATEMENTS = {
+    resource_type: _typeahead_statements(resource_type)
+    for resource_type in TYPEAHEAD_SOURCES
+}
+
+
+def _run_typeahead(db: Session, resource_type: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
+    """Run the prebuilt typeahead statement for a resource type"""
+    browse, search = TYPEAHEAD_STATEMENTS[resource_type]
     if query:
-        search_pattern = f"%{query}%"
-        base_query = base_query.filter(
-            or_(
-                User.name.ilike(search_pattern),
-                User.email.ilike(search_pattern)
-            )
-        )
-    
-    # TODO: Sort by "most contacted" - requires contact tracking
-    # For now, sort by name
-    users = base_query.order_by(User.name).limit(count).all()
+        rows = db.execute(search, {"pattern": prefix_pattern(query), "count": count}).all()
+    else:
+        rows = db.execute(browse, {"count": count}).all()
     
     return [
-        AsanaNamedResource(
-            gid=user.gid,
-            resource_type=user.resource_type or "user",
-            name=user.name
-        )
-        for user in users
+        AsanaNamedResource(gid=row.gid, resource_type=row.resource_type, name=row.name)
+        for row in rows
     ]
 
 
+def search_users(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
+    """Search users in a workspace"""
+    return _run_typeahead(db, "user", query, count)
+
+
 def search_projects(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
     """Search projects in a workspace"""
-    base_query = db.query(Project)
-    
-    if query:
-        search_pattern = f"%{query}%"
-        base_query = base_query.filter(Project.name.ilike(search_pattern))
-    
-    # TODO: Sort by recency - requires visit tracking
-    # For now, sort by created_at descending
-    projects = base_query.order_by(Project.created_at.desc()).limit(count).all()
-    
-    return [
-        AsanaNamedResource(
-            gid=project.gid,
-            resource_type=project.resource_type or "project",
-            name=project.name
-        )
-        for project in projects
-    ]
+    return _run_typeahead(db, "project", query, count)
 
 
 def search_tasks(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
     """Search tasks in a workspace"""
-    base_query = db.query(Task)
-    
-    if query:
-        search_pattern = f"%{query}%"
-        base_query = base_query.filter(Task.name.ilike(search_pattern))
-    
-    # TODO: Prioritize followed tasks - requires follow tracking
-    # For now, sort by created_at descending
-    tasks = base_query.order_by(Task.created_at.desc()).limit(count).all()
-    
-    return [
-        AsanaNamedResource(
-            gid=task.gid,
-            resource_type=task.resource_type or "task",
-            name=task.name
-        )
-        for task in tasks
-    ]
+    return _run_typeahead(db, "task", query, count)
 
 
 def search_tags(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
     """Search tags in a workspace"""
-    base_query = db.query(Tag)
-    
-    if query:
-        search_pattern = f"%{query}%"
-        base_query = base_query.filter(Tag.name.ilike(search_pattern))
-    
-    tags = base_query.order_by(Tag.name).limit(count).all()
-    
-    return [
-        AsanaNamedResource(
-            gid=tag.gid,
-            resource_type=tag.resource_type or "tag",
-            name=tag.name
-        )
-        for tag in tags
-    ]
+    return _run_typeahead(db, "tag", query, count)
 
 
 def search_teams(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
     """Search teams in a workspace"""
-    base_query = db.query(Team)
-    
-    if query:
-        search_pattern = f"%{query}%"
-        base_query = base_query.filter(Team.name.ilike(search_pattern))
-    
-    teams = base_query.order_by(Team.name).limit(count).all()
-    
-    return [
-        AsanaNamedResource(
-            gid=team.gid,
-            resource_type=team.resource_type or "team",
-            name=team.name
-        )
-        for team in teams
-    ]
+    return _run_typeahead(db, "team", query, count)
 
 
 def search_custom_fields(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
     """Search custom fields in a workspace"""
-    base_query = db.query(CustomField)
-    
-    if query:
-        search_pattern = f"%{query}%"
-        base_query = base_query.filter(CustomField.name.ilike(search_pattern))
-    
-    custom_fields = base_query.order_by(CustomField.name).limit(count).all()
-    
-    return [
-        AsanaNamedResource(
-            gid=cf.gid,
-            resource_type=cf.resource_type or "custom_field",
-            name=cf.name
-        )
-        for cf in custom_fields
-    ]
+    return _run_typeahead(db, "custom_field", query, count)
 
 
 def search_project_templates(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
     """Search project templates in a workspace"""
-    # Note: Project templates are projects with a specific flag or type
-    # For now, we'll search projects and filter by name
-    # TODO: Add project_template model or flag when available
-    base_query = db.query(Project)
-    
-    if query:
-        search_pattern = f"%{query}%"
-        base_query = base_query.filter(Project.name.ilike(search_pattern))
-    
-    # TODO: Prioritize favorited templates - requires favorites tracking
-    # For now, sort by name
-    projects = base_query.order_by(Project.name).limit(count).all()
-    
-    return [
-        AsanaNamedResource(
-            gid=project.gid,
-            resource_type="project_template",  # Override to match expected type
-            name=project.name
-        )
-        for project in projects
-    ]
-
-
-def search_portfolios(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
-    """Search portfolios in a workspace"""
-    # TODO: Implement when Portfolio model exists
-    # For now, return empty list
-    return []
+    return _run_typeahead(db, "project_template", query, count)
 
 
-def search_goals(db: Session, workspace_gid: str, query: Optional[str], count: int) -> List[AsanaNamedResource]:
-    """Search goals in a workspace"""
-    # TODO: Implement when Goal model exists
-    # For now, return empty list
-    return []
+# resource_type -> resource-specific typeahead search function. portfolio and
+# goal have no models yet (TODO), so they fall through to an empty result
+SEARCH_FUNCTIONS = {
+    "user": search_users,
+    "project": search_projects,
+    "task": search_tasks,
+    "tag": search_tags,
+    "team": search_teams,
+    "custom_field": search_custom_fields,
+    "project_template": search_project_templates,
+}
 
 
 def search_typeahead(
@@ -220,21 +209,69 @@ def search_typeahead(
     Returns:
         List of AsanaNamedResource objects
     """
-    search_functions = {
-        "user": search_users,
-        "project": search_projects,
-        "task": search_tasks,
-        "tag": search_tags,
-        "team": search_teams,
-        "custom_field": search_custom_fields,
-        "project_template": search_project_templates,
-        "portfolio": search_portfolios,
-        "goal": search_goals,
-    }
-    
-    search_func = search_functions.get(resource_type)
+    search_func = SEARCH_FUNCTIONS.get(resource_type)
     if not search_func:
         return []
     
-    return search_func(db, workspace_gid, query, count)
+    return _cached_typeahead(
+        (resource_type, workspace_gid, query, count),
+        lambda: search_func(db, workspace_gid, query, count)
+    )
+
+
 
+def search_typeahead_multi(
+    db: Session,
+    workspace_gid: str,
+    resource_types: List[str],
+    query: Optional[str],
+    count: int
+) -> List[AsanaNamedResource]:
+    """
+    Typeahead search across several resource types in one UNION ALL query.
+    
+    Each resource type contributes up to count rows, in the order the types
+    were requested. Types without a backing table (portfolio, goal) are skipped.
+    
+    Args:
+        db: Database session
+        workspace_gid: Workspace GID to search within
+        resource_types: Types of resource to search for
+        query: Optional search query string
+        count: Maximum number of results to return per resource type
+    
+    Returns:
+        List of AsanaNamedResource objects
+    """
+    search_pattern = prefix_pattern(query) if query else None
+    
+    selects = []
+    for position, resource_type in enumerate(resource_types):
+        source = TYPEAHEAD_SOURCES.get(resource_type)
+        if source is None:
+            continue
+        model, columns, order_by = source
+        stmt = select(
+            model.gid.label("gid"),
+            _resource_type_column(resource_type, model).label("resource_type"),
+            model.name.label("name"),
+            literal(position).label("position"),
+        )
+        if search_pattern:
+            stmt = stmt.where(or_(*(func.lower(column).like(search_pattern, escape="\\") for column in columns)))
+        selects.append(select(stmt.order_by(order_by).limit(count).subquery()))
+    
+    if not selects:
+        return []
+    
+    def search() -> List[AsanaNamedResource]:
+        rows = db.execute(union_all(*selects)).all()
+        # UNION ALL does not promise to keep member order; regroup by requested
+        # type while keeping each member's own ordering (sort is stable)
+        rows.sort(key=lambda row: row.position)
+        return [
+            AsanaNamedResource(gid=row.gid, resource_type=row.resource_type, name=row.name)
+            for row in rows
+        ]
+    
+    return _cached_typeahead((tuple(resource_types), workspace_gid, query, count), search)
@@ -0,0 +1,28 @@
+"""index_task_modified_at
+
+Revision ID: 5052556946c6
+Revises: 44a99a0ba7dc
+Create Date: 2026-10-16 10:12:31.418206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5052556946c6'
+down_revision: Union[str, Sequence[str], None] = '44a99a0ba7dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_task_modified_at'), 'task', ['modified_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_task_modified_at'), table_name='task')
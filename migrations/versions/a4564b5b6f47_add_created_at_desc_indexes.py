@@ -0,0 +1,30 @@
+"""add_created_at_desc_indexes
+
+Revision ID: a4564b5b6f47
+Revises: d56b98f32607
+Create Date: 2026-10-16 13:36:42.190574
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4564b5b6f47'
+down_revision: Union[str, Sequence[str], None] = 'd56b98f32607'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_project_created_at_desc', 'project', [sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_task_created_at_desc', 'task', [sa.text('created_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_created_at_desc', table_name='task')
+    op.drop_index('ix_project_created_at_desc', table_name='project')
@@ -0,0 +1,36 @@
+"""add_task_search_tsv
+
+Revision ID: d56b98f32607
+Revises: fed4e59b389f
+Create Date: 2026-10-16 12:21:08.675913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd56b98f32607'
+down_revision: Union[str, Sequence[str], None] = 'fed4e59b389f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('task', sa.Column(
+        'search_tsv',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', coalesce(name, '') || ' ' || coalesce(notes, ''))", persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_task_search_tsv', 'task', ['search_tsv'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_search_tsv', table_name='task')
+    op.drop_column('task', 'search_tsv')
@@ -0,0 +1,47 @@
+"""add_typeahead_prefix_indexes
+
+Revision ID: fed4e59b389f
+Revises: 5052556946c6
+Create Date: 2026-10-16 11:47:20.338541
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fed4e59b389f'
+down_revision: Union[str, Sequence[str], None] = '5052556946c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs prefix-matched by typeahead as lower(column) LIKE 'q%'
+PREFIX_COLUMNS = [
+    ('task', 'name'),
+    ('user', 'name'),
+    ('user', 'email'),
+    ('project', 'name'),
+    ('tag', 'name'),
+    ('team', 'name'),
+    ('custom_field', 'name'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in PREFIX_COLUMNS:
+        op.create_index(
+            f'ix_{table}_{column}_prefix',
+            table,
+            [sa.text(f'lower({column}) text_pattern_ops')],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(PREFIX_COLUMNS):
+        op.drop_index(f'ix_{table}_{column}_prefix', table_name=table)
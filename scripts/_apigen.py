@@ -0,0 +1,142 @@
+"""Shared pieces of the API endpoint generator: resource config, template and field mapping"""
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+
+API_DIR = Path(__file__).parent.parent / "app" / "api" / "v1"
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Parsed once and substituted per resource
+API_ENDPOINT_TEMPLATE = Template((TEMPLATES_DIR / "api_endpoint.py.tmpl").read_text(encoding="utf-8"))
+
+RESOURCE_CONFIG = {
+    "projects": {
+        "model": "Project",
+        "table": "project",
+        "singular": "project",
+        "response": "ProjectResponse",
+        "create": "ProjectCreate",
+        "update": "ProjectUpdate"
+    },
+    "tasks": {
+        "model": "Task",
+        "table": "task",
+        "singular": "task",
+        "response": "TaskResponse",
+        "create": "TaskCreate",
+        "update": "TaskUpdate"
+    },
+    "teams": {
+        "model": "Team",
+        "table": "team",
+        "singular": "team",
+        "response": "TeamResponse",
+        "create": "TeamCreate",
+        "update": "TeamUpdate"
+    },
+    "sections": {
+        "model": "Section",
+        "table": "section",
+        "singular": "section",
+        "response": "SectionResponse",
+        "create": "SectionCreate",
+        "update": "SectionUpdate"
+    },
+    "attachments": {
+        "model": "Attachment",
+        "table": "attachment",
+        "singular": "attachment",
+        "response": "AttachmentResponse",
+        "create": "AttachmentCreate",
+        "update": "AttachmentUpdate"
+    },
+    "stories": {
+        "model": "Story",
+        "table": "story",
+        "singular": "story",
+        "response": "StoryResponse",
+        "create": "StoryCreate",
+        "update": "StoryUpdate"
+    },
+    "tags": {
+        "model": "Tag",
+        "table": "tag",
+        "singular": "tag",
+        "response": "TagResponse",
+        "create": "TagCreate",
+        "update": "TagUpdate"
+    },
+    "webhooks": {
+        "model": "Webhook",
+        "table": "webhook",
+        "singular": "webhook",
+        "response": "WebhookResponse",
+        "create": "WebhookCreate",
+        "update": "WebhookUpdate"
+    },
+    "custom_fields": {
+        "model": "CustomField",
+        "table": "custom_field",
+        "singular": "custom_field",
+        "response": "CustomFieldResponse",
+        "create": "CustomFieldCreate",
+        "update": "CustomFieldUpdate"
+    }
+}
+
+# Timestamp columns are never mapped into response schemas
+EXCLUDED_RESPONSE_FIELDS = frozenset({'created_at', 'updated_at'})
+
+@lru_cache(maxsize=None)
+def get_model_fields(model_class):
+    """Get all column names from a SQLAlchemy model"""
+    return tuple(c.name for c in model_class.__table__.columns)
+
+def generate_field_mapping(fields, obj_var="obj"):
+    """Generate field mapping for response schema"""
+    return ",\n                    ".join(
+        f"{field}={obj_var}.{field}" for field in fields if field not in EXCLUDED_RESPONSE_FIELDS
+    )
+
+@lru_cache(maxsize=None)
+def _mapping_for(model_class, obj_var="obj"):
+    """Pre-joined response field mapping for a model, built once per model/variable"""
+    return generate_field_mapping(get_model_fields(model_class), obj_var)
+
+def create_api_file(resource_name, config, model_class):
+    """Create API endpoint file"""
+    field_mapping = _mapping_for(model_class)
+    
+    model_name = config["model"]
+    table_name = config["table"]
+    singular = config["singular"]
+    response_schema = config["response"]
+    create_schema = config["create"]
+    update_schema = config["update"]
+    
+    # Handle special case for resource_type default
+    resource_type_default = table_name.replace("_", "")
+    
+    content = API_ENDPOINT_TEMPLATE.substitute(
+        model_name=model_name,
+        table_name=table_name,
+        resource_name=resource_name,
+        singular=singular,
+        response_schema=response_schema,
+        create_schema=create_schema,
+        update_schema=update_schema,
+        resource_type=resource_type_default,
+        field_mapping=field_mapping,
+        new_obj_field_mapping=_mapping_for(model_class, "new_obj"),
+    )
+    
+    return content
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly these bytes"""
+    new = content.encode("utf-8")
+    # A size mismatch settles it from a stat() without reading the old file
+    if path.exists() and path.stat().st_size == len(new) and path.read_bytes() == new:
+        return False
+    path.write_bytes(new)
+    return True
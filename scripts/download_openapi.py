@@ -1,9 +1,18 @@
 """Download and validate Asana OpenAPI Specification"""
+import heapq
+import importlib.util
+
 import httpx
+import orjson
 import yaml
-import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # OpenAPI Specification URL
 OPENAPI_URL = "https://raw.githubusercontent.com/Asana/openapi/master/defs/asana_oas.yaml"
@@ -11,13 +20,51 @@ OPENAPI_URL = "https://raw.githubusercontent.com/Asana/openapi/master/defs/asana
 # Output directory
 OUTPUT_DIR = Path(__file__).parent.parent / "openapi_spec"
 
+# HTTP/2 needs the optional h2 package (httpx[http2]). httpx already negotiates
+# gzip/deflate, and adds br/zstd to Accept-Encoding when those decoders are installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# ETag/Last-Modified of the last download, kept next to the saved spec
+CACHE_FILE = ".cache.json"
+
+
+def _load_validators(output_dir: Path) -> Dict[str, str]:
+    """
+    Conditional-request headers for the previously downloaded spec.
+    
+    Only offered when the saved JSON exists, since that is what a 304 is
+    answered from.
+    """
+    cache_path = output_dir / CACHE_FILE
+    if not (cache_path.exists() and (output_dir / "asana_oas.json").exists()):
+        return {}
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+    except orjson.JSONDecodeError:
+        return {}
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
 
-def download_openapi_spec() -> Dict[str, Any]:
+def download_openapi_spec(output_dir: Path = OUTPUT_DIR) -> Tuple[Dict[str, Any], bool]:
     """
     Download Asana OpenAPI specification from GitHub.
     
+    The YAML body is streamed straight to ``output_dir/asana_oas.yaml`` and
+    parsed from disk, so the spec is never held twice in memory. The response
+    ETag/Last-Modified are kept in ``output_dir/.cache.json``; when the server
+    answers 304 the previously saved JSON is loaded instead.
+    
+    Args:
+        output_dir: Directory the downloaded YAML is written to
+    
     Returns:
-        Parsed OpenAPI specification as dictionary
+        Parsed OpenAPI specification as dictionary, and whether it was
+        freshly downloaded (False when served from the local copy)
     
     Raises:
         httpx.HTTPError: If download fails
@@ -25,29 +72,52 @@ def download_openapi_spec() -> Dict[str, Any]:
     """
     print(f"Downloading OpenAPI spec from {OPENAPI_URL}...")
     
+    output_dir.mkdir(parents=True, exist_ok=True)
+    yaml_path = output_dir / "asana_oas.yaml"
+    
     try:
-        response = httpx.get(OPENAPI_URL, timeout=30.0)
-        response.raise_for_status()
-        print(f"✓ Downloaded successfully ({len(response.content)} bytes)")
+        with httpx.Client(http2=HTTP2_AVAILABLE, timeout=30.0) as client:
+            with client.stream("GET", OPENAPI_URL, headers=_load_validators(output_dir)) as response:
+                if response.status_code == 304:
+                    print("✓ Not modified, using saved spec")
+                    return orjson.loads((output_dir / "asana_oas.json").read_bytes()), False
+                response.raise_for_status()
+                with open(yaml_path, "wb") as f:
+                    for chunk in response.iter_bytes(65536):
+                        f.write(chunk)
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+        print(f"✓ Downloaded successfully ({yaml_path.stat().st_size} bytes)")
+        print(f"✓ Saved YAML to {yaml_path}")
     except httpx.HTTPError as e:
         print(f"✗ Failed to download OpenAPI spec: {e}")
         raise
     
     # Parse YAML
     try:
-        spec = yaml.safe_load(response.text)
+        with open(yaml_path, "rb") as f:
+            spec = yaml.load(f, Loader=SafeLoader)
         print("✓ YAML parsed successfully")
     except yaml.YAMLError as e:
         print(f"✗ Failed to parse YAML: {e}")
         raise
     
-    return spec
+    # Drop the JSON of the previous spec so a 304 can never be answered from it
+    (output_dir / "asana_oas.json").unlink(missing_ok=True)
+    (output_dir / CACHE_FILE).write_bytes(orjson.dumps(validators))
+    
+    return spec, True
 
 
 def save_spec(spec: Dict[str, Any], output_dir: Path) -> None:
     """
     Save OpenAPI specification to files.
     
+    The YAML copy is only written when it is not already on disk from
+    download_openapi_spec.
+    
     Args:
         spec: Parsed OpenAPI specification
         output_dir: Directory to save files
@@ -56,14 +126,14 @@ def save_spec(spec: Dict[str, Any], output_dir: Path) -> None:
     
     # Save as YAML
     yaml_path = output_dir / "asana_oas.yaml"
-    with open(yaml_path, "w", encoding="utf-8") as f:
-        yaml.dump(spec, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-    print(f"✓ Saved YAML to {yaml_path}")
+    if not yaml_path.exists():
+        with open(yaml_path, "w", encoding="utf-8") as f:
+            yaml.dump(spec, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        print(f"✓ Saved YAML to {yaml_path}")
     
-    # Save as JSON (for easier programmatic access)
+    # Save as JSON (for easier programmatic access); YAML status codes parse as int keys
     json_path = output_dir / "asana_oas.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(spec, f, indent=2, ensure_ascii=False)
+    json_path.write_bytes(orjson.dumps(spec, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
     print(f"✓ Saved JSON to {json_path}")
 
 
@@ -123,7 +193,7 @@ def analyze_spec(spec: Dict[str, Any]) -> None:
     
     if response_schemas:
         print("\nFirst 10 Response schemas:")
-        for schema_name in sorted(response_schemas)[:10]:
+        for schema_name in heapq.nsmallest(10, response_schemas):
             print(f"  - {schema_name}")
         if len(response_schemas) > 10:
             print(f"  ... and {len(response_schemas) - 10} more")
@@ -151,15 +221,18 @@ def extract_core_resources(spec: Dict[str, Any]) -> Dict[str, list]:
     resource_endpoints = {}
     
     for path, methods in paths.items():
-        for resource in core_resources:
-            if f"/{resource}" in path.lower():
-                if resource not in resource_endpoints:
-                    resource_endpoints[resource] = []
-                resource_endpoints[resource].append({
-                    "path": path,
-                    "methods": list(methods.keys())
-                })
-                break
+        # One lowercase + split per path; each resource is then a set lookup
+        segments = set(path.lower().split("/"))
+        # First core resource (in list order) that appears as a path segment
+        resource = next((r for r in core_resources if r in segments), None)
+        if resource is not None:
+            method_names = list(methods)
+            resource_endpoints.setdefault(resource, []).append({
+                "path": path,
+                "methods": method_names,
+                # Display form, built once here rather than on every print
+                "methods_str": ", ".join(method_names).upper()
+            })
     
     return resource_endpoints
 
@@ -168,10 +241,11 @@ def main():
     """Main function"""
     try:
         # Download spec
-        spec = download_openapi_spec()
+        spec, fresh = download_openapi_spec()
         
-        # Save spec
-        save_spec(spec, OUTPUT_DIR)
+        # Save spec (an unmodified spec is already on disk)
+        if fresh:
+            save_spec(spec, OUTPUT_DIR)
         
         # Analyze spec
         analyze_spec(spec)
@@ -184,7 +258,7 @@ def main():
         for resource, endpoints in resources.items():
             print(f"\n{resource.upper()}:")
             for endpoint in endpoints[:5]:  # Show first 5 endpoints
-                print(f"  {', '.join(endpoint['methods']).upper():6} {endpoint['path']}")
+                print(f"  {endpoint['methods_str']:6} {endpoint['path']}")
             if len(endpoints) > 5:
                 print(f"  ... and {len(endpoints) - 5} more endpoints")
         
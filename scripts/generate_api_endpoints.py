@@ -1,8 +1,5 @@
 """Generate API endpoints for all resources"""
-from pathlib import Path
-import re
-
-API_DIR = Path(__file__).parent.parent / "app" / "api" / "v1"
+from _apigen import API_DIR, API_ENDPOINT_TEMPLATE, generate_field_mapping
 
 RESOURCES = {
     "users": {
@@ -119,243 +116,20 @@ RESOURCES = {
 
 def generate_api_file(resource_name: str, config: dict) -> str:
     """Generate API endpoint file for a resource"""
-    
-    model_name = config["model"]
-    response_schema = config["schema_response"]
-    create_schema = config["schema_create"]
-    update_schema = config["schema_update"]
-    table_name = config["table_name"]
     fields = config["fields"]
     
-    # Build field mapping for response
-    field_mappings = []
-    for field in fields:
-        if field in ["gid", "resource_type"]:
-            field_mappings.append(f"{field}=obj.{field}")
-        else:
-            field_mappings.append(f"{field}=obj.{field}")
-    
-    field_str = ",\n                    ".join(field_mappings)
-    
-    code = f'''"""{{model_name}}s API Endpoints"""
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from typing import Optional
-from app.database import get_db
-from app.models.{table_name} import {model_name}
-from app.schemas.{table_name} import {response_schema}, {create_schema}, {update_schema}
-from app.utils.pagination import PaginationParams, create_paginated_response
-from app.utils.responses import format_success_response, format_list_response, format_error_response
-from app.utils.errors import NotFoundError
-from app.config import settings
-
-router = APIRouter()
-
-
-@router.get("/{resource_name}", response_model=dict)
-async def get_{resource_name}(
-    pagination: PaginationParams = Depends(),
-    db: Session = Depends(get_db)
-):
-    """
-    Get all {resource_name}.
-    
-    Returns a list of all {resource_name} accessible to the authenticated user.
-    """
-    try:
-        items = db.query({model_name}).all()
-        
-        paginated = create_paginated_response(
-            items=items,
-            limit=pagination.limit,
-            offset=pagination.offset,
-            base_path=f"{{settings.API_V1_PREFIX}}/{resource_name}"
-        )
-        
-        response_data = {{
-            "data": [
-                {response_schema}(
-                    {field_str}
-                ).model_dump(exclude_none=True)
-                for obj in paginated.data
-            ]
-        }}
-        
-        if paginated.has_more and paginated.next_offset:
-            response_data["next_page"] = {{
-                "offset": paginated.next_offset,
-                "path": f"{{settings.API_V1_PREFIX}}/{resource_name}",
-                "uri": f"{{settings.API_V1_PREFIX}}/{resource_name}?limit={{pagination.limit}}&offset={{paginated.next_offset}}"
-            }}
-        
-        return response_data
-    
-    except Exception as e:
-        return format_error_response(
-            message=str(e),
-            status_code=500
-        )
-
-
-@router.get("/{resource_name}/{{{resource_name}_gid}}", response_model=dict)
-async def get_{resource_name[:-1]}(
-    {resource_name}_gid: str,
-    opt_fields: Optional[str] = Query(None),
-    opt_pretty: Optional[bool] = Query(False),
-    db: Session = Depends(get_db)
-):
-    """
-    Get a specific {resource_name[:-1]}.
-    
-    Returns the full record for a single {resource_name[:-1]}.
-    """
-    try:
-        obj = db.query({model_name}).filter({model_name}.gid == {resource_name}_gid).first()
-        
-        if not obj:
-            raise NotFoundError("{model_name}", f"{{resource_name}_gid}")
-        
-        obj_response = {response_schema}(
-            {field_str}
-        )
-        
-        return format_success_response(obj_response)
-    
-    except NotFoundError as e:
-        return format_error_response(
-            message=str(e.message),
-            help_text=str(e.help_text),
-            status_code=e.status_code
-        )
-    except Exception as e:
-        return format_error_response(
-            message=str(e),
-            status_code=500
-        )
-
-
-@router.post("/{resource_name}", response_model=dict)
-async def create_{resource_name[:-1]}(
-    {resource_name}_data: {create_schema},
-    opt_fields: Optional[str] = Query(None),
-    opt_pretty: Optional[bool] = Query(False),
-    db: Session = Depends(get_db)
-):
-    """
-    Create a {resource_name[:-1]}.
-    
-    Creates a new {resource_name[:-1]}.
-    """
-    try:
-        import uuid
-        
-        new_obj = {model_name}(
-            gid=str(uuid.uuid4()),
-            resource_type="{table_name}",
-            **{resource_name}_data.model_dump(exclude_unset=True)
-        )
-        
-        db.add(new_obj)
-        db.commit()
-        db.refresh(new_obj)
-        
-        obj_response = {response_schema}(
-            {field_str}
-        )
-        
-        return format_success_response(obj_response, status_code=201)
-    
-    except Exception as e:
-        db.rollback()
-        return format_error_response(
-            message=str(e),
-            status_code=500
-        )
-
-
-@router.put("/{resource_name}/{{{resource_name}_gid}}", response_model=dict)
-async def update_{resource_name[:-1]}(
-    {resource_name}_gid: str,
-    {resource_name}_data: {update_schema},
-    opt_fields: Optional[str] = Query(None),
-    opt_pretty: Optional[bool] = Query(False),
-    db: Session = Depends(get_db)
-):
-    """
-    Update a {resource_name[:-1]}.
-    
-    Updates the fields of a {resource_name[:-1]}. Only the fields provided in the request will be updated.
-    """
-    try:
-        obj = db.query({model_name}).filter({model_name}.gid == {resource_name}_gid).first()
-        
-        if not obj:
-            raise NotFoundError("{model_name}", f"{{resource_name}_gid}}")
-        
-        update_dict = {resource_name}_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            if hasattr(obj, field):
-                setattr(obj, field, value)
-        
-        db.commit()
-        db.refresh(obj)
-        
-        obj_response = {response_schema}(
-            {field_str}
-        )
-        
-        return format_success_response(obj_response)
-    
-    except NotFoundError as e:
-        return format_error_response(
-            message=str(e.message),
-            help_text=str(e.help_text),
-            status_code=e.status_code
-        )
-    except Exception as e:
-        db.rollback()
-        return format_error_response(
-            message=str(e),
-            status_code=500
-        )
-
-
-@router.delete("/{resource_name}/{{{resource_name}_gid}}", response_model=dict)
-async def delete_{resource_name[:-1]}(
-    {resource_name}_gid: str,
-    db: Session = Depends(get_db)
-):
-    """
-    Delete a {resource_name[:-1]}.
-    
-    Deletes a {resource_name[:-1]}.
-    """
-    try:
-        obj = db.query({model_name}).filter({model_name}.gid == {resource_name}_gid).first()
-        
-        if not obj:
-            raise NotFoundError("{model_name}", f"{{resource_name}_gid}}")
-        
-        db.delete(obj)
-        db.commit()
-        
-        return format_success_response({{"data": {{}}}}, status_code=200)
-    
-    except NotFoundError as e:
-        return format_error_response(
-            message=str(e.message),
-            help_text=str(e.help_text),
-            status_code=e.status_code
-        )
-    except Exception as e:
-        db.rollback()
-        return format_error_response(
-            message=str(e),
-            status_code=500
-        )
-'''
-    
-    return code
+    return API_ENDPOINT_TEMPLATE.substitute(
+        model_name=config["model"],
+        table_name=config["table_name"],
+        resource_name=resource_name,
+        singular=config["table_name"],
+        response_schema=config["schema_response"],
+        create_schema=config["schema_create"],
+        update_schema=config["schema_update"],
+        resource_type=config["table_name"],
+        field_mapping=generate_field_mapping(fields),
+        new_obj_field_mapping=generate_field_mapping(fields, obj_var="new_obj"),
+    )
 
 def main():
     """Generate all API endpoint files"""
@@ -372,8 +146,7 @@ def main():
         code = generate_api_file(resource_name, config)
         
         api_file = API_DIR / f"{resource_name}.py"
-        with open(api_file, "w", encoding="utf-8") as f:
-            f.write(code)
+        api_file.write_bytes(code.encode("utf-8"))
         
         print(f"  ✓ Generated {api_file}")
     
@@ -41,23 +41,37 @@ class SchemaResolver:
     def __init__(self, spec: Dict[str, Any]):
         self.spec = spec
         self.schemas = spec.get("components", {}).get("schemas", {})
+        # Component schemas keyed by their full $ref string
+        self._by_ref = {f"#/components/schemas/{name}": schema for name, schema in self.schemas.items()}
         self._resolved_cache: Dict[str, Dict[str, Any]] = {}
+        # Fully resolved schemas by $ref string, and merged allOf schemas by id()
+        # (spec dicts stay alive as long as the resolver, so ids are stable)
+        self._ref_cache: Dict[str, Dict[str, Any]] = {}
+        self._merged_cache: Dict[int, Dict[str, Any]] = {}
     
     def resolve_ref(self, ref: str) -> Dict[str, Any]:
         """Resolve a $ref reference"""
+        schema = self._by_ref.get(ref)
+        if schema is not None:
+            return schema
+        
         if not ref.startswith("#/components/schemas/"):
             raise ValueError(f"Unsupported ref format: {ref}")
-        
-        schema_name = ref.split("/")[-1]
-        return self.schemas.get(schema_name, {})
+        return {}
     
     def resolve_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve a schema, following allOf and $ref"""
         if "$ref" in schema:
-            ref_schema = self.resolve_ref(schema["$ref"])
-            return self.resolve_schema(ref_schema)
+            ref = schema["$ref"]
+            resolved = self._ref_cache.get(ref)
+            if resolved is None:
+                resolved = self._ref_cache[ref] = self.resolve_schema(self.resolve_ref(ref))
+            return resolved
         
         if "allOf" in schema:
+            cached = self._merged_cache.get(id(schema))
+            if cached is not None:
+                return cached
             # Merge all schemas in allOf
             merged = {"type": "object", "properties": {}, "required": []}
             for item in schema["allOf"]:
@@ -66,6 +80,7 @@ class SchemaResolver:
                     merged["properties"].update(resolved["properties"])
                 if "required" in resolved:
                     merged["required"].extend(resolved["required"])
+            self._merged_cache[id(schema)] = merged
             return merged
         
         return schema
@@ -442,8 +457,7 @@ class SchemaGenerator:
         init_lines.append("]")
         
         init_file = SCHEMAS_DIR / "__init__.py"
-        with open(init_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(init_lines))
+        init_file.write_bytes("\n".join(init_lines).encode("utf-8"))
         
         print(f"\n✓ Generated {init_file}")
 